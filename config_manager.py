@@ -26,7 +26,8 @@ class ConfigManager:
                 "dead_zone_radius": 10,
                 "acceleration_curve": "linear",
                 "frame_rate": 30,
-                "tracking_quality_threshold": 0.8
+                "tracking_quality_threshold": 0.8,
+                "use_iris_refine": True  # False skips FaceMesh's iris sub-model and tracks the eye centre
             },
             "gestures": {
                 "blink_threshold": 0.004,
@@ -59,7 +60,8 @@ class ConfigManager:
                 "max_cpu_usage": 15.0,
                 "max_memory_mb": 200,
                 "adaptive_quality": True,
-                "low_latency_mode": True
+                "low_latency_mode": True,
+                "core_pins": {}  # e.g. {"detect": [2], "capture": [1], "tracking": [1], "plugin": [3]}
             }
         }
 
@@ -7,9 +7,10 @@ import cv2
 import numpy as np
 import time
 import math
-from typing import Tuple, List, Optional, Dict, Any
+from typing import Tuple, List, Optional, Dict
 import logging
 from collections import deque
+from tracking_data import TrackingData
 
 class EyeTrackerOpenCV:
     def __init__(self, config_manager):
@@ -27,6 +28,9 @@ class EyeTrackerOpenCV:
         self.camera = None
         self.frame_width = 640
         self.frame_height = 480
+        self.drain_stale_frames = False  # Set when the driver ignores CAP_PROP_BUFFERSIZE
+        self.fresh_grab_time = 0.0
+        self.max_drain_frames = 5
 
         # Tracking state
         self.is_calibrated = False
@@ -61,39 +65,69 @@ class EyeTrackerOpenCV:
             # Set camera properties for optimal performance
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_width)
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_height)
-            self.camera.set(cv2.CAP_PROP_FPS, self.config.get_setting("tracking", "frame_rate", 30))
-            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            frame_rate = self.config.get_setting("tracking", "frame_rate", 30)
+            self.camera.set(cv2.CAP_PROP_FPS, frame_rate)
+
+            # A grab that blocks for half a frame period waited on the sensor, so it is fresh
+            self.fresh_grab_time = 0.5 / frame_rate
+            self.drain_stale_frames = not self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            if self.drain_stale_frames:
+                logging.warning("Camera driver ignored CAP_PROP_BUFFERSIZE=1, latency may be elevated; "
+                                "draining queued frames before each read")
 
             return True
         except Exception as e:
             logging.error(f"Camera initialization failed: {e}")
             return False
 
-    def process_frame(self) -> Tuple[Optional[np.ndarray], Dict[str, Any]]:
-        """Process a single frame and extract eye tracking data"""
+    def _read_frame(self, latest_only: bool = False) -> Tuple[bool, Optional[np.ndarray]]:
+        """Read the next frame, or the newest one if stale frames may be queued"""
+        if latest_only or self.drain_stale_frames:
+            return self.grab_latest()
+        return self.camera.read()
+
+    def grab_latest(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Discard frames queued by the driver and decode only the newest one"""
+        # Queued frames grab instantly; stop once a grab has to wait for the sensor
+        for _ in range(self.max_drain_frames):
+            grab_start = time.perf_counter()
+            if not self.camera.grab():
+                return False, None
+            if time.perf_counter() - grab_start >= self.fresh_grab_time:
+                break
+
+        return self.camera.retrieve()
+
+    def process_frame(self, latest_only: bool = False) -> Tuple[Optional[np.ndarray], TrackingData]:
+        """Process a single frame and extract eye tracking data
+
+        latest_only skips any frames that queued up while the caller was busy.
+        """
+        frame = self.capture_frame(latest_only)
+        if frame is None:
+            return None, TrackingData()
+
+        return frame, self.analyze_frame(frame)
+
+    def capture_frame(self, latest_only: bool = False) -> Optional[np.ndarray]:
+        """Read a mirrored frame from the camera"""
         if not self.camera:
-            return None, {}
-
-        start_time = time.time()
+            return None
 
-        ret, frame = self.camera.read()
+        ret, frame = self._read_frame(latest_only)
         if not ret:
-            return None, {}
+            return None
 
         # Flip frame horizontally for mirror effect
-        frame = cv2.flip(frame, 1)
+        return cv2.flip(frame, 1)
+
+    def analyze_frame(self, frame: np.ndarray) -> TrackingData:
+        """Extract eye tracking data from a frame returned by capture_frame"""
+        start_time = time.perf_counter()
+
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
-        tracking_data = {
-            "frame": frame,
-            "face_rect": None,
-            "eyes": [],
-            "eye_position": None,
-            "blink_detected": False,
-            "tracking_quality": 0.0,
-            "left_eye_ratio": 0.0,
-            "right_eye_ratio": 0.0
-        }
+        tracking_data = TrackingData(frame)
 
         # Detect faces
         faces = self.face_cascade.detectMultiScale(gray, 1.3, 5)
@@ -102,7 +136,7 @@ class EyeTrackerOpenCV:
             # Use the largest face
             face = max(faces, key=lambda rect: rect[2] * rect[3])
             x, y, w, h = face
-            tracking_data["face_rect"] = face
+            tracking_data.face_rect = face
             self.last_face_rect = face
             self.face_lost_frames = 0
 
@@ -116,23 +150,23 @@ class EyeTrackerOpenCV:
             if len(eyes) >= 2:
                 # Sort eyes by x-coordinate (left to right)
                 eyes = sorted(eyes, key=lambda eye: eye[0])
-                tracking_data["eyes"] = eyes
+                tracking_data.eyes = eyes
 
                 # Calculate eye position
                 eye_position = self._calculate_eye_position_from_eyes(eyes, face, frame.shape)
                 if eye_position:
                     # Apply smoothing
                     smoothed_position = self._apply_smoothing(eye_position)
-                    tracking_data["eye_position"] = smoothed_position
+                    tracking_data.eye_position = smoothed_position
 
                     # Calculate tracking quality
-                    tracking_data["tracking_quality"] = self._calculate_tracking_quality(len(eyes))
+                    tracking_data.tracking_quality = self._calculate_tracking_quality(len(eyes))
 
                     # Detect blinks (simplified for OpenCV)
                     left_ratio, right_ratio = self._calculate_eye_ratios_opencv(eyes, face_gray)
-                    tracking_data["left_eye_ratio"] = left_ratio
-                    tracking_data["right_eye_ratio"] = right_ratio
-                    tracking_data["blink_detected"] = self._detect_blink(left_ratio, right_ratio)
+                    tracking_data.left_eye_ratio = left_ratio
+                    tracking_data.right_eye_ratio = right_ratio
+                    tracking_data.blink_detected = self._detect_blink(left_ratio, right_ratio)
 
                     # Draw debug information
                     self._draw_debug_info(frame, face, eyes)
@@ -140,13 +174,13 @@ class EyeTrackerOpenCV:
             self.face_lost_frames += 1
             # Use last known face position for a few frames
             if self.last_face_rect is not None and self.face_lost_frames < 10:
-                tracking_data["face_rect"] = self.last_face_rect
+                tracking_data.face_rect = self.last_face_rect
 
         # Update performance metrics
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         self.processing_times.append(processing_time)
 
-        return frame, tracking_data
+        return tracking_data
 
     def _calculate_eye_position_from_eyes(self, eyes, face_rect, frame_shape) -> Optional[Tuple[float, float]]:
         """Calculate normalized eye position from detected eyes"""
@@ -305,12 +339,12 @@ class EyeTrackerOpenCV:
 
         return points
 
-    def add_calibration_point(self, screen_point: Tuple[float, float], eye_data: List[Tuple[float, float]]) -> bool:
-        """Add a calibration point with corresponding eye data"""
-        if eye_data:
+    def add_calibration_point(self, screen_point: Tuple[float, float], eye_data: np.ndarray) -> bool:
+        """Add a calibration point with corresponding eye data (an (N, 2) array or list of positions)"""
+        eye_data = np.asarray(eye_data, dtype=np.float32)
+        if len(eye_data):
             # Average the eye positions for this calibration point
-            avg_x = sum(pos[0] for pos in eye_data) / len(eye_data)
-            avg_y = sum(pos[1] for pos in eye_data) / len(eye_data)
+            avg_x, avg_y = eye_data.mean(axis=0).tolist()
 
             self.calibration_data[screen_point] = (avg_x, avg_y)
             return True
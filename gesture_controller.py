@@ -11,6 +11,7 @@ from collections import deque
 import logging
 from enum import Enum
 from eye_gesture_advanced import AdvancedEyeGestureDetector
+import input_backend
 
 class GestureType(Enum):
     SINGLE_BLINK = "single_blink"
@@ -141,9 +142,9 @@ class GestureController:
     def _move_cursor(self, position: Tuple[int, int]):
         """Move cursor with optimized performance"""
         try:
-            # Performance optimization: Use direct movement with no duration
-            # This eliminates the latency caused by PyAutoGUI's built-in smoothing
-            pyautogui.moveTo(position[0], position[1])
+            # Performance optimization: Send the move straight to the OS
+            # This skips PyAutoGUI's wrapper stack and its per-call pause
+            input_backend.move_to(position[0], position[1])
 
         except Exception as e:
             logging.error(f"Error moving cursor: {e}")
@@ -242,7 +243,7 @@ class GestureController:
 
         if all(movement > 10 for movement in y_movements):
             # Scrolling down
-            pyautogui.scroll(-3)
+            input_backend.scroll(-3)
             return {
                 "type": GestureType.GAZE_SCROLL,
                 "action": "scroll_down",
@@ -250,7 +251,7 @@ class GestureController:
             }
         elif all(movement < -10 for movement in y_movements):
             # Scrolling up
-            pyautogui.scroll(3)
+            input_backend.scroll(3)
             return {
                 "type": GestureType.GAZE_SCROLL,
                 "action": "scroll_up",
@@ -341,7 +342,7 @@ class GestureController:
     def _perform_left_click(self):
         """Perform left mouse click with enhanced error handling"""
         try:
-            pyautogui.click()
+            input_backend.click("left")
             logging.debug("Left click executed successfully")
         except Exception as e:
             logging.error(f"Error performing left click: {e}")
@@ -349,7 +350,7 @@ class GestureController:
     def _perform_right_click(self):
         """Perform right mouse click with enhanced error handling"""
         try:
-            pyautogui.rightClick()
+            input_backend.click("right")
             logging.debug("Right click executed successfully")
         except Exception as e:
             logging.error(f"Error performing right click: {e}")
@@ -357,7 +358,7 @@ class GestureController:
     def _perform_middle_click(self):
         """Perform middle mouse click"""
         try:
-            pyautogui.middleClick()
+            input_backend.click("middle")
             logging.debug("Middle click executed successfully")
         except Exception as e:
             logging.error(f"Error performing middle click: {e}")
@@ -368,13 +369,13 @@ class GestureController:
             scroll_amount = 3
 
             if action_type == "scroll_up":
-                pyautogui.scroll(scroll_amount)
+                input_backend.scroll(scroll_amount)
             elif action_type == "scroll_down":
-                pyautogui.scroll(-scroll_amount)
+                input_backend.scroll(-scroll_amount)
             elif action_type == "scroll_left":
-                pyautogui.hscroll(-scroll_amount)
+                input_backend.hscroll(-scroll_amount)
             elif action_type == "scroll_right":
-                pyautogui.hscroll(scroll_amount)
+                input_backend.hscroll(scroll_amount)
 
             logging.debug(f"Scroll action {action_type} executed (angle: {angle:.1f}°)")
         except Exception as e:
@@ -12,10 +12,22 @@ import math
 import time
 import json
 import logging
+import threading
 from enum import IntEnum
-from collections import deque
 from typing import Dict, List, Tuple, Optional
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -44,6 +56,32 @@ class GestureType(IntEnum):
     PEACE = 37
     OK_SIGN = 38
 
+# Gestures that fire a discrete action and must only be acted on for freshly inferred frames
+CLICK_GESTURES = frozenset({
+    GestureType.INDEX,
+    GestureType.MID,
+    GestureType.V_GESTURE,
+    GestureType.TWO_FINGER_CLOSED,
+})
+
+# Frames between MediaPipe inferences for the last recognized gesture.
+# Cursor motion needs every frame; held/idle gestures only need ~10 Hz.
+INFER_EVERY: Dict[GestureType, int] = {
+    GestureType.PALM: 1,
+    GestureType.PINCH_MAJOR: 2,
+    GestureType.PINCH_MINOR: 2,
+}
+DEFAULT_INFER_EVERY = 3
+
+# Landmark index pairs joined when drawing the hand skeleton
+_HAND_EDGES = np.array([
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)
+], dtype=np.int32)
+
 class HandLabel(IntEnum):
     """Hand labels for multi-hand detection"""
     LEFT = 0
@@ -52,38 +90,38 @@ class HandLabel(IntEnum):
 class ReinforcementLearner:
     """Simple reinforcement learning for gesture adaptation"""
 
+    # Gesture encodings fit well below this bound, so they index the arrays directly
+    MAX_GESTURES = 64
+
     def __init__(self):
-        self.gesture_success_rates = {}
-        self.gesture_attempts = {}
+        self.gesture_success_rates = np.full(self.MAX_GESTURES, 0.5, dtype=np.float32)
+        self.gesture_attempts = np.zeros(self.MAX_GESTURES, dtype=np.int32)
         self.learning_rate = 0.1
         self.confidence_threshold = 0.7
 
     def record_gesture_attempt(self, gesture: int, success: bool):
         """Record gesture attempt and success/failure"""
-        if gesture not in self.gesture_attempts:
-            self.gesture_attempts[gesture] = 0
-            self.gesture_success_rates[gesture] = 0.5
-
         self.gesture_attempts[gesture] += 1
 
         # Update success rate using exponential moving average
         current_rate = self.gesture_success_rates[gesture]
-        new_rate = current_rate + self.learning_rate * (1.0 if success else 0.0 - current_rate)
+        target = 1.0 if success else 0.0
+        new_rate = current_rate + self.learning_rate * (target - current_rate)
         self.gesture_success_rates[gesture] = max(0.1, min(0.9, new_rate))
 
     def get_gesture_confidence(self, gesture: int) -> float:
         """Get confidence level for a gesture"""
-        return self.gesture_success_rates.get(gesture, 0.5)
+        return float(self.gesture_success_rates[gesture])
 
     def should_execute_gesture(self, gesture: int) -> bool:
         """Determine if gesture should be executed based on confidence"""
-        return self.get_gesture_confidence(gesture) >= self.confidence_threshold
+        return self.gesture_success_rates[gesture] >= self.confidence_threshold
 
     def save_learning_data(self, filepath: str):
         """Save learning data to file"""
         data = {
-            'success_rates': self.gesture_success_rates,
-            'attempts': self.gesture_attempts
+            'success_rates': self.gesture_success_rates.tolist(),
+            'attempts': self.gesture_attempts.tolist()
         }
         with open(filepath, 'w') as f:
             json.dump(data, f)
@@ -93,11 +131,75 @@ class ReinforcementLearner:
         try:
             with open(filepath, 'r') as f:
                 data = json.load(f)
-                self.gesture_success_rates = data.get('success_rates', {})
-                self.gesture_attempts = data.get('attempts', {})
+                self._load_array(self.gesture_success_rates, data.get('success_rates', []))
+                self._load_array(self.gesture_attempts, data.get('attempts', []))
         except FileNotFoundError:
             logging.info("No previous learning data found, starting fresh")
 
+    @staticmethod
+    def _load_array(target: np.ndarray, values):
+        """Copy saved values into a per-gesture array (accepts the list or legacy dict format)"""
+        if isinstance(values, dict):
+            items = ((int(gesture), value) for gesture, value in values.items())
+        else:
+            items = enumerate(values)
+
+        for gesture, value in items:
+            if 0 <= gesture < len(target):
+                target[gesture] = value
+
+def _landmarks_to_ndarray(landmarks) -> np.ndarray:
+    """Convert MediaPipe hand landmarks into a (21, 3) float32 array"""
+    return np.fromiter((c for lm in landmarks.landmark for c in (lm.x, lm.y, lm.z)),
+                       dtype=np.float32, count=63).reshape(21, 3)
+
+@njit(cache=True, fastmath=True)
+def classify(arr, is_right):
+    """Compute (finger_state, gesture) for a (21, 3) landmark array
+
+    Returns raw integers; callers convert to GestureType at the Python boundary.
+    """
+    # Thumb extends sideways, other fingers extend upwards
+    fs = 0
+    if arr[4, 0] > arr[3, 0]:
+        fs |= 1
+    if arr[8, 1] < arr[6, 1]:
+        fs |= 2
+    if arr[12, 1] < arr[10, 1]:
+        fs |= 4
+    if arr[16, 1] < arr[14, 1]:
+        fs |= 8
+    if arr[20, 1] < arr[18, 1]:
+        fs |= 16
+
+    gesture = 31  # PALM
+    if fs == 0:  # All fingers closed
+        gesture = 0  # FIST
+    elif fs == 6:  # Index and middle finger up
+        dx = arr[8, 0] - arr[12, 0]
+        dy = arr[8, 1] - arr[12, 1]
+        if dx * dx + dy * dy > 0.0025:  # 0.05 squared
+            gesture = 33  # V_GESTURE
+        else:
+            gesture = 34  # TWO_FINGER_CLOSED
+    elif fs == 2:  # Only index finger up
+        gesture = 8  # INDEX
+    elif fs == 4:  # Only middle finger up
+        gesture = 4  # MID
+    elif fs == 31:  # All fingers up
+        gesture = 31  # PALM
+    else:
+        # Check for pinch gestures
+        dx = arr[4, 0] - arr[8, 0]
+        dy = arr[4, 1] - arr[8, 1]
+        if dx * dx + dy * dy < 0.0025:  # 0.05 squared
+            if is_right:
+                gesture = 35  # PINCH_MAJOR
+            else:
+                gesture = 36  # PINCH_MINOR
+
+    return fs, gesture
+
 class HandGestureRecognizer:
     """Advanced hand gesture recognition with MediaPipe"""
 
@@ -108,92 +210,47 @@ class HandGestureRecognizer:
         self.previous_gesture = GestureType.PALM
         self.frame_count = 0
         self.hand_landmarks = None
-        self.gesture_history = deque(maxlen=5)
+        self._arr = None  # (21, 3) float32 landmark array, rebuilt once per update
 
     def update_landmarks(self, landmarks):
         """Update hand landmarks"""
         self.hand_landmarks = landmarks
+        self._arr = _landmarks_to_ndarray(landmarks) if landmarks is not None else None
 
     def get_distance(self, point1: int, point2: int) -> float:
         """Calculate Euclidean distance between two landmarks"""
-        if not self.hand_landmarks:
+        if self._arr is None:
             return 0.0
 
-        p1 = self.hand_landmarks.landmark[point1]
-        p2 = self.hand_landmarks.landmark[point2]
-
-        return math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2)
+        dx = self._arr[point1, 0] - self._arr[point2, 0]
+        dy = self._arr[point1, 1] - self._arr[point2, 1]
+        return math.sqrt(dx * dx + dy * dy)
 
     def get_signed_distance(self, point1: int, point2: int) -> float:
         """Calculate signed distance (considering y-axis direction)"""
-        if not self.hand_landmarks:
+        if self._arr is None:
             return 0.0
 
-        p1 = self.hand_landmarks.landmark[point1]
-        p2 = self.hand_landmarks.landmark[point2]
-
-        sign = 1 if p1.y < p2.y else -1
-        dist = math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2)
-        return dist * sign
+        sign = 1 if self._arr[point1, 1] < self._arr[point2, 1] else -1
+        return self.get_distance(point1, point2) * sign
 
-    def detect_finger_states(self):
-        """Detect which fingers are extended"""
-        if not self.hand_landmarks:
-            return
-
-        # Finger tip and joint landmarks
-        finger_tips = [4, 8, 12, 16, 20]  # Thumb, Index, Middle, Ring, Pinky
-        finger_joints = [3, 6, 10, 14, 18]
-
-        self.finger_state = 0
+    def get_hand_position(self) -> Tuple[float, float]:
+        """Get normalized index finger tip position"""
+        if self._arr is None:
+            return None, None
 
-        # Check each finger
-        for i, (tip, joint) in enumerate(zip(finger_tips, finger_joints)):
-            if i == 0:  # Thumb (different logic)
-                if self.hand_landmarks.landmark[tip].x > self.hand_landmarks.landmark[joint].x:
-                    self.finger_state |= (1 << i)
-            else:  # Other fingers
-                if self.hand_landmarks.landmark[tip].y < self.hand_landmarks.landmark[joint].y:
-                    self.finger_state |= (1 << i)
+        return float(self._arr[8, 0]), float(self._arr[8, 1])
 
     def recognize_gesture(self) -> int:
         """Recognize current gesture based on finger states and positions"""
-        if not self.hand_landmarks:
+        if self._arr is None:
             return GestureType.PALM
 
-        self.detect_finger_states()
-
-        # Gesture recognition logic
-        current_gesture = GestureType.PALM
-
-        # Check for specific gestures
-        if self.finger_state == 0:  # All fingers closed
-            current_gesture = GestureType.FIST
-        elif self.finger_state == 6:  # Index and middle finger up
-            # Check if it's V gesture or peace sign
-            index_middle_dist = self.get_distance(8, 12)
-            if index_middle_dist > 0.05:
-                current_gesture = GestureType.V_GESTURE
-            else:
-                current_gesture = GestureType.TWO_FINGER_CLOSED
-        elif self.finger_state == 2:  # Only index finger up
-            current_gesture = GestureType.INDEX
-        elif self.finger_state == 4:  # Only middle finger up
-            current_gesture = GestureType.MID
-        elif self.finger_state == 31:  # All fingers up
-            current_gesture = GestureType.PALM
-        else:
-            # Check for pinch gestures
-            thumb_index_dist = self.get_distance(4, 8)
-            if thumb_index_dist < 0.05:
-                if self.hand_label == HandLabel.RIGHT:
-                    current_gesture = GestureType.PINCH_MAJOR
-                else:
-                    current_gesture = GestureType.PINCH_MINOR
+        # Finger states and raw gesture from the compiled kernel
+        self.finger_state, raw_gesture = classify(self._arr, self.hand_label == HandLabel.RIGHT)
+        current_gesture = GestureType(raw_gesture)
 
         # Gesture stabilization
-        self.gesture_history.append(current_gesture)
-
         if current_gesture == self.previous_gesture:
             self.frame_count += 1
         else:
@@ -213,12 +270,12 @@ class GestureController:
     def __init__(self):
         # MediaPipe setup
         self.mp_hands = mp.solutions.hands
-        self.mp_drawing = mp.solutions.drawing_utils
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
+            max_num_hands=1,
+            model_complexity=0,
+            min_detection_confidence=0.6,
+            min_tracking_confidence=0.5
         )
 
         # Camera setup
@@ -230,10 +287,14 @@ class GestureController:
 
         # Screen dimensions
         self.screen_width, self.screen_height = pyautogui.size()
+        self._screen = np.array([self.screen_width, self.screen_height], dtype=np.float32)
+        self._screen_max = self._screen - 1
 
-        # Hand recognizers
-        self.right_hand = HandGestureRecognizer(HandLabel.RIGHT)
-        self.left_hand = HandGestureRecognizer(HandLabel.LEFT)
+        # Compile the gesture kernel up front so the first frame doesn't stall
+        classify(np.zeros((21, 3), dtype=np.float32), True)
+
+        # Hand recognizer (single tracked hand; label follows MediaPipe's handedness)
+        self.hand = HandGestureRecognizer(HandLabel.RIGHT)
 
         # Control state
         self.cursor_enabled = True
@@ -246,7 +307,28 @@ class GestureController:
 
         # Performance tracking
         self.frame_count = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+
+        # Inference skipping: run MediaPipe every N frames (N adapts to the current
+        # gesture, see INFER_EVERY) and reuse the last results in between
+        self._infer_every = DEFAULT_INFER_EVERY
+        self._infer_tick = 0
+        self._last_results = None
+
+        # Cached status overlay, re-rendered every N frames (~10 Hz at 30 FPS)
+        self._ui_cache = None
+        self._ui_mask = None
+        self._ui_tick = 0
+        self._ui_every = 3
+
+        # Mouse output thread: latest-wins cursor target plus accumulated scroll
+        self._mouse_target = None
+        self._scroll_pending = 0
+        self._mouse_lock = threading.Lock()
+        self._mouse_evt = threading.Event()
+        self._mouse_running = True
+        self._mouse_thread = threading.Thread(target=self._mouse_output_loop, daemon=True)
+        self._mouse_thread.start()
 
         # Reinforcement learning
         self.rl_agent = ReinforcementLearner()
@@ -268,42 +350,59 @@ class GestureController:
         print("   🤏 PINCH - Scroll")
         print("   Press 'q' to quit, 'c' to toggle cursor, 's' for sensitivity")
 
-    def get_hand_position(self, landmarks) -> Tuple[float, float]:
+    def get_hand_position(self, hand: HandGestureRecognizer) -> Tuple[float, float]:
         """Get normalized hand position for cursor control"""
-        if not landmarks:
-            return None, None
-
         # Use index finger tip for cursor position
-        index_tip = landmarks.landmark[8]
-        return index_tip.x, index_tip.y
+        return hand.get_hand_position()
 
     def smooth_cursor_movement(self, new_x: float, new_y: float) -> Tuple[int, int]:
         """Apply smoothing to cursor movement"""
+        new_pos = np.array([new_x, new_y], dtype=np.float32)
         if self.last_cursor_pos is None:
-            self.last_cursor_pos = (new_x, new_y)
-
-        # Apply smoothing
-        smooth_x = self.last_cursor_pos[0] * self.cursor_smoothing + new_x * (1 - self.cursor_smoothing)
-        smooth_y = self.last_cursor_pos[1] * self.cursor_smoothing + new_y * (1 - self.cursor_smoothing)
-
-        self.last_cursor_pos = (smooth_x, smooth_y)
-
-        # Convert to screen coordinates
-        screen_x = int(smooth_x * self.screen_width * self.sensitivity)
-        screen_y = int(smooth_y * self.screen_height * self.sensitivity)
-
-        # Clamp to screen bounds
-        screen_x = max(0, min(self.screen_width - 1, screen_x))
-        screen_y = max(0, min(self.screen_height - 1, screen_y))
-
-        return screen_x, screen_y
-
-    def execute_gesture_action(self, gesture: int, hand_landmarks):
+            self.last_cursor_pos = new_pos
+
+        # Apply smoothing, convert to screen coordinates and clamp to screen bounds
+        self.last_cursor_pos = self.last_cursor_pos * self.cursor_smoothing + new_pos * (1 - self.cursor_smoothing)
+        screen_pos = np.clip(self.last_cursor_pos * self._screen * self.sensitivity, 0, self._screen_max)
+
+        return int(screen_pos[0]), int(screen_pos[1])
+
+    def _mouse_output_loop(self):
+        """Apply the most recent cursor target and pending scroll off the main loop"""
+        while self._mouse_running:
+            self._mouse_evt.wait()
+            self._mouse_evt.clear()
+
+            with self._mouse_lock:
+                target = self._mouse_target
+                scroll_amount = self._scroll_pending
+                self._mouse_target = None
+                self._scroll_pending = 0
+
+            try:
+                if target:
+                    pyautogui.moveTo(*target, _pause=False)
+                if scroll_amount:
+                    pyautogui.scroll(scroll_amount, _pause=False)
+            except Exception as e:
+                logging.error(f"Error in mouse output thread: {e}")
+
+    def queue_cursor_move(self, screen_x: int, screen_y: int):
+        """Hand the cursor target to the output thread, replacing any pending one"""
+        with self._mouse_lock:
+            self._mouse_target = (screen_x, screen_y)
+        self._mouse_evt.set()
+
+    def queue_scroll(self, amount: int):
+        """Accumulate a scroll amount for the output thread"""
+        with self._mouse_lock:
+            self._scroll_pending += amount
+        self._mouse_evt.set()
+
+    def execute_gesture_action(self, gesture: int, hand: HandGestureRecognizer, now: float):
         """Execute action based on recognized gesture"""
-        current_time = time.time()
-
         # Check cooldown
-        if current_time - self.last_gesture_time < self.gesture_cooldown:
+        if now - self.last_gesture_time < self.gesture_cooldown:
             return
 
         # Check if RL agent recommends executing this gesture
@@ -316,10 +415,10 @@ class GestureController:
         try:
             if gesture == GestureType.PALM and self.cursor_enabled:
                 # Move cursor
-                hand_x, hand_y = self.get_hand_position(hand_landmarks)
+                hand_x, hand_y = self.get_hand_position(hand)
                 if hand_x is not None and hand_y is not None:
                     screen_x, screen_y = self.smooth_cursor_movement(hand_x, hand_y)
-                    pyautogui.moveTo(screen_x, screen_y)
+                    self.queue_cursor_move(screen_x, screen_y)
                     success = True
 
             elif gesture == GestureType.INDEX and self.click_enabled:
@@ -327,14 +426,14 @@ class GestureController:
                 pyautogui.click()
                 print("🖱️ Left Click")
                 success = True
-                self.last_gesture_time = current_time
+                self.last_gesture_time = now
 
             elif gesture == GestureType.MID and self.click_enabled:
                 # Right click
                 pyautogui.rightClick()
                 print("🖱️ Right Click")
                 success = True
-                self.last_gesture_time = current_time
+                self.last_gesture_time = now
 
             elif gesture == GestureType.V_GESTURE:
                 # Toggle drag mode
@@ -346,7 +445,7 @@ class GestureController:
                     pyautogui.mouseUp()
                     print("🔓 Drag Mode OFF")
                 success = True
-                self.last_gesture_time = current_time
+                self.last_gesture_time = now
 
             elif gesture == GestureType.FIST:
                 # Hold/drag
@@ -358,7 +457,7 @@ class GestureController:
 
             elif gesture == GestureType.PINCH_MAJOR or gesture == GestureType.PINCH_MINOR:
                 # Scroll functionality
-                hand_x, hand_y = self.get_hand_position(hand_landmarks)
+                hand_x, hand_y = self.get_hand_position(hand)
                 if hand_x is not None and hand_y is not None:
                     if self.pinch_start_pos is None:
                         self.pinch_start_pos = (hand_x, hand_y)
@@ -369,7 +468,7 @@ class GestureController:
 
                         if abs(dy) > 0.02:  # Vertical scroll
                             scroll_amount = int(dy * 10)
-                            pyautogui.scroll(scroll_amount)
+                            self.queue_scroll(scroll_amount)
                             print(f"📜 Scroll: {scroll_amount}")
                             self.pinch_start_pos = (hand_x, hand_y)
                             success = True
@@ -379,7 +478,7 @@ class GestureController:
                 pyautogui.doubleClick()
                 print("🖱️ Double Click")
                 success = True
-                self.last_gesture_time = current_time
+                self.last_gesture_time = now
 
         except Exception as e:
             logging.error(f"Error executing gesture {gesture}: {e}")
@@ -393,34 +492,31 @@ class GestureController:
         if not results.multi_hand_landmarks:
             return
 
-        # Reset hand landmarks
-        self.right_hand.update_landmarks(None)
-        self.left_hand.update_landmarks(None)
-
-        # Process each detected hand
-        for idx, (hand_landmarks, handedness) in enumerate(zip(results.multi_hand_landmarks, results.multi_handedness)):
-            # Determine if it's left or right hand
-            hand_label = handedness.classification[0].label
-
-            if hand_label == "Right":
-                self.right_hand.update_landmarks(hand_landmarks)
-            else:
-                self.left_hand.update_landmarks(hand_landmarks)
+        # Only one hand is tracked; determine if it's left or right
+        hand_label = results.multi_handedness[0].classification[0].label
+        self.hand.hand_label = HandLabel.RIGHT if hand_label == "Right" else HandLabel.LEFT
+        self.hand.update_landmarks(results.multi_hand_landmarks[0])
 
     def draw_landmarks(self, image, results):
         """Draw hand landmarks on the image"""
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+        if not results.multi_hand_landmarks or self.hand._arr is None:
+            return
 
-    def draw_ui_info(self, image):
-        """Draw UI information on the image"""
+        # Pixel coordinates from the cached landmark array
         h, w, _ = image.shape
+        pts = (self.hand._arr[:, :2] * (w, h)).astype(np.int32)
+
+        cv2.polylines(image, list(pts[_HAND_EDGES]), False, (0, 255, 0), 2)
+        for x, y in pts:
+            cv2.circle(image, (int(x), int(y)), 3, (0, 0, 255), -1)
+
+    def render_ui_overlay(self, shape, now: float) -> np.ndarray:
+        """Render the status text onto a blank BGR overlay"""
+        overlay = np.zeros(shape, dtype=np.uint8)
+        h, w, _ = shape
 
         # Performance info
-        current_time = time.time()
-        elapsed = current_time - self.start_time
+        elapsed = now - self.start_time
         fps = self.frame_count / elapsed if elapsed > 0 else 0
 
         # Status information
@@ -435,23 +531,34 @@ class GestureController:
 
         # Draw status
         for i, line in enumerate(status_lines):
-            cv2.putText(image, line, (10, 30 + i * 25),
+            cv2.putText(overlay, line, (10, 30 + i * 25),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
 
         # Draw gesture info
-        right_gesture = self.right_hand.current_gesture
-        left_gesture = self.left_hand.current_gesture
+        gesture = self.hand.current_gesture
 
         gesture_info = [
-            f"Right: {GestureType(right_gesture).name}",
-            f"Left: {GestureType(left_gesture).name}",
-            f"RL Confidence: {self.rl_agent.get_gesture_confidence(right_gesture):.2f}"
+            f"Hand: {HandLabel(self.hand.hand_label).name.title()}",
+            f"Gesture: {GestureType(gesture).name}",
+            f"RL Confidence: {self.rl_agent.get_gesture_confidence(gesture):.2f}"
         ]
 
         for i, line in enumerate(gesture_info):
-            cv2.putText(image, line, (w - 300, 30 + i * 25),
+            cv2.putText(overlay, line, (w - 300, 30 + i * 25),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
 
+        return overlay
+
+    def draw_ui_info(self, image, now: float):
+        """Draw UI information on the image (overlay is re-rendered every few frames)"""
+        if (self._ui_cache is None or self._ui_cache.shape != image.shape
+                or self._ui_tick % self._ui_every == 0):
+            self._ui_cache = self.render_ui_overlay(image.shape, now)
+            self._ui_mask = self._ui_cache.any(axis=2, keepdims=True)
+        self._ui_tick += 1
+
+        # Copy only the text pixels onto the frame
+        np.copyto(image, self._ui_cache, where=self._ui_mask)
         return image
 
     def run(self):
@@ -467,40 +574,43 @@ class GestureController:
                 if not success:
                     continue
 
+                # One monotonic timestamp per frame for cooldowns and FPS
+                now = time.monotonic()
+
                 # Flip image horizontally for mirror effect
                 image = cv2.flip(image, 1)
 
-                # Convert BGR to RGB
-                rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                rgb_image.flags.writeable = False
-
-                # Process hands
-                results = self.hands.process(rgb_image)
-
-                # Convert back to BGR
-                rgb_image.flags.writeable = True
-                image = cv2.cvtColor(rgb_image, cv2.COLOR_RGB2BGR)
+                # Process hands (only every N frames, reuse previous landmarks otherwise)
+                self._infer_tick += 1
+                inferred = self._infer_tick % self._infer_every == 0 or self._last_results is None
+                if inferred:
+                    # MediaPipe gets an RGB copy; drawing stays on the untouched BGR image
+                    rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+                    rgb_image.flags.writeable = False
+                    results = self.hands.process(rgb_image)
+                    self._last_results = results
+                else:
+                    results = self._last_results
 
-                # Process detected hands
-                self.process_hands(results)
+                # Process detected hands (skipped frames keep the previous landmark arrays)
+                if inferred:
+                    self.process_hands(results)
 
-                # Recognize gestures and execute actions
-                right_gesture = self.right_hand.recognize_gesture()
-                left_gesture = self.left_hand.recognize_gesture()
+                # Recognize gesture and execute action
+                gesture = self.hand.recognize_gesture()
+                self._infer_every = INFER_EVERY.get(gesture, DEFAULT_INFER_EVERY)
 
-                # Execute primary hand gesture (right hand priority)
-                if self.right_hand.hand_landmarks:
-                    self.execute_gesture_action(right_gesture, self.right_hand.hand_landmarks)
-                elif self.left_hand.hand_landmarks:
-                    self.execute_gesture_action(left_gesture, self.left_hand.hand_landmarks)
+                if self.hand.hand_landmarks:
+                    if inferred or gesture not in CLICK_GESTURES:
+                        self.execute_gesture_action(gesture, self.hand, now)
 
                 # Reset pinch position if no pinch gesture
-                if right_gesture not in [GestureType.PINCH_MAJOR, GestureType.PINCH_MINOR]:
+                if gesture not in [GestureType.PINCH_MAJOR, GestureType.PINCH_MINOR]:
                     self.pinch_start_pos = None
 
                 # Draw landmarks and UI
                 self.draw_landmarks(image, results)
-                image = self.draw_ui_info(image)
+                image = self.draw_ui_info(image, now)
 
                 # Display image
                 cv2.imshow('Advanced Gesture Controller', image)
@@ -537,6 +647,11 @@ class GestureController:
         """Clean up resources"""
         print("🧹 Cleaning up...")
 
+        # Stop the mouse output thread
+        self._mouse_running = False
+        self._mouse_evt.set()
+        self._mouse_thread.join(timeout=1.0)
+
         # Release mouse if in drag mode
         if self.drag_mode:
             pyautogui.mouseUp()
@@ -550,14 +665,14 @@ class GestureController:
         cv2.destroyAllWindows()
 
         # Final statistics
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         avg_fps = self.frame_count / elapsed if elapsed > 0 else 0
 
         print(f"📊 Session Statistics:")
         print(f"   Runtime: {elapsed:.1f}s")
         print(f"   Frames: {self.frame_count}")
         print(f"   Average FPS: {avg_fps:.1f}")
-        print(f"   Gesture attempts: {sum(self.rl_agent.gesture_attempts.values())}")
+        print(f"   Gesture attempts: {int(self.rl_agent.gesture_attempts.sum())}")
         print("✅ Cleanup completed")
 
 def main():
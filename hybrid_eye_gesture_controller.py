@@ -8,14 +8,31 @@ import cv2
 import mediapipe as mp
 import pyautogui
 import numpy as np
-import math
+import os
+import sys
 import time
 import json
 import logging
+import queue
+import threading
 from enum import IntEnum
+from types import SimpleNamespace
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -39,6 +56,105 @@ class GestureType(IntEnum):
     PINCH = 5
     THUMBS_UP = 6
 
+# Static labels of the status panel, pre-rendered once (values are drawn per frame)
+UI_LABELS = ("FPS:", "Mode:", "Gesture:", "Drag:", "Eye Sens:", "Frames:")
+
+# Stand-in for a MediaPipe result when a model is skipped for the current mode
+_NO_RESULTS = SimpleNamespace(multi_face_landmarks=None, multi_hand_landmarks=None)
+
+def _fill_per_gesture(target: np.ndarray, values):
+    """Copy saved per-gesture values into an array indexed by GestureType
+
+    Accepts the list format as well as older files keyed by gesture number
+    (JSON turns those keys into strings).
+    """
+    if isinstance(values, dict):
+        items = ((int(gesture), value) for gesture, value in values.items())
+    else:
+        items = enumerate(values)
+
+    for gesture, value in items:
+        if 0 <= gesture < len(target):
+            target[gesture] = value
+
+def _make_move():
+    """Bind a direct absolute cursor-move function for this platform
+
+    Falls back to pyautogui.moveTo when no native backend is available.
+    """
+    if sys.platform == 'win32':
+        import ctypes
+        set_cursor_pos = ctypes.windll.user32.SetCursorPos
+
+        def move(x, y):
+            set_cursor_pos(int(x), int(y))
+        return move
+
+    if sys.platform.startswith('linux'):
+        try:
+            from Xlib import display as xdisplay
+            disp = xdisplay.Display()
+            root = disp.screen().root
+
+            def move(x, y):
+                root.warp_pointer(int(x), int(y))
+                disp.sync()
+            return move
+        except Exception as e:
+            logging.warning(f"Xlib cursor backend unavailable, using pyautogui: {e}")
+
+    def move(x, y):
+        pyautogui.moveTo(x, y, _pause=False)
+    return move
+
+def _landmarks_to_xy(landmarks) -> np.ndarray:
+    """Copy MediaPipe landmarks into an (N, 2) float32 array of normalized x, y"""
+    return np.fromiter((v for p in landmarks for v in (p.x, p.y)),
+                       dtype=np.float32, count=2 * len(landmarks)).reshape(-1, 2)
+
+@njit(cache=True)
+def _recognize(lm):
+    """Classify a (21, 2) hand landmark array into a GestureType value"""
+    # Finger tip and joint landmarks: thumb, index, middle, ring, pinky
+    finger_tips = (4, 8, 12, 16, 20)
+    finger_joints = (3, 6, 10, 14, 18)
+
+    # Check which fingers are extended
+    fingers_up = np.zeros(5, dtype=np.int32)
+
+    # Thumb (different logic due to orientation)
+    if lm[finger_tips[0], 0] > lm[finger_joints[0], 0]:
+        fingers_up[0] = 1
+
+    # Other fingers
+    for i in range(1, 5):
+        if lm[finger_tips[i], 1] < lm[finger_joints[i], 1]:
+            fingers_up[i] = 1
+
+    # Recognize gestures based on finger states
+    total_fingers = fingers_up.sum()
+
+    if total_fingers == 0:
+        return 0  # FIST
+    elif total_fingers == 1 and fingers_up[1] == 1:  # Only index
+        return 1  # INDEX
+    elif total_fingers == 1 and fingers_up[2] == 1:  # Only middle
+        return 2  # MIDDLE
+    elif total_fingers == 2 and fingers_up[1] == 1 and fingers_up[2] == 1:  # Index + middle
+        return 3  # PEACE
+    elif total_fingers == 1 and fingers_up[0] == 1:  # Only thumb
+        return 6  # THUMBS_UP
+    elif total_fingers == 5:
+        return 4  # PALM
+    else:
+        # Check for pinch gesture (squared distance against 0.05 squared)
+        dx = lm[4, 0] - lm[8, 0]
+        dy = lm[4, 1] - lm[8, 1]
+        if dx * dx + dy * dy < 0.0025:
+            return 5  # PINCH
+
+    return 4  # PALM
+
 class HybridController:
     """Hybrid controller combining eye tracking and hand gestures"""
 
@@ -61,10 +177,19 @@ class HybridController:
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=2,
+            model_complexity=0,
             min_detection_confidence=0.7,
             min_tracking_confidence=0.7
         )
 
+        # Status messages are printed by a background thread, off the frame loop
+        self._log_q = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_drain, daemon=True)
+        self._log_thread.start()
+
+        # Face mesh and hands run concurrently on the same frame
+        self._pool = ThreadPoolExecutor(max_workers=2)
+
         # Camera setup
         self.cap = cv2.VideoCapture(0)
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
@@ -72,9 +197,21 @@ class HybridController:
         self.cap.set(cv2.CAP_PROP_FPS, 30)
         self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
+        # Capture thread keeps only the newest frame in a single slot
+        self._latest = None
+        self._latest_id = 0
+        self._latest_lock = threading.Lock()
+        self._running = True
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+
         # Screen dimensions
         self.screen_w, self.screen_h = pyautogui.size()
 
+        # Direct cursor backend (bypasses pyautogui's per-call overhead)
+        self._move = _make_move()
+        self._last_xy = None  # Last cursor position sent to the backend
+
         # Control settings
         self.control_mode = ControlMode.HYBRID
         self.eye_sensitivity = 1.2
@@ -82,31 +219,57 @@ class HybridController:
         self.smoothing_factor = 0.6
 
         # Eye tracking state
-        self.eye_position_history = deque(maxlen=5)
-        self.blink_history = deque(maxlen=3)
+        self._ema = None  # Exponentially smoothed eye position
         self.blink_threshold = 0.004
         self.last_blink_time = 0
         self.blink_cooldown = 0.8
 
         # Gesture tracking state
         self.current_gesture = GestureType.PALM
-        self.gesture_history = deque(maxlen=5)
+        self.gesture_history = deque(maxlen=3)
+        self._gesture_counts = np.zeros(len(GestureType), dtype=np.int8)  # Votes in gesture_history
         self.last_gesture_time = 0
         self.gesture_cooldown = 0.5
         self.drag_mode = False
 
+        # Temporal subsampling: run detectors every detect_stride frames and reuse
+        # the last results in between, extrapolating the cursor along its velocity
+        self.detect_stride = 2
+        self.detect_size = (320, 240)  # MediaPipe input resolution
+        self._frame_idx = 0
+        self._last_face_results = None
+        self._last_hand_results = None
+        self._face_lm = None
+        self._last_eye_raw = None
+        self._eye_velocity = (0.0, 0.0)
+
+        # Non-blocking key polling (cv2.pollKey needs OpenCV >= 4.5)
+        self._poll_key = cv2.pollKey if hasattr(cv2, 'pollKey') else lambda: cv2.waitKey(1)
+
+        # Status panel labels
+        self._render_ui_labels()
+
         # Performance tracking
         self.frame_count = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
         # Reinforcement learning data
-        self.gesture_success_rates = {}
-        self.gesture_attempts = {}
+        self.gesture_success_rates = np.full(len(GestureType), 0.5, dtype=np.float32)
+        self.gesture_attempts = np.zeros(len(GestureType), dtype=np.int32)
         self.learning_rate = 0.1
 
         # Load previous learning data
         self.load_learning_data()
 
+        # Compile the gesture kernel up front so the first hand doesn't stall
+        _recognize(np.zeros((21, 2), dtype=np.float32))
+
+        # Warm up both MediaPipe graphs (constructed once and reused across mode
+        # switches) so model initialization doesn't land on the first real frame
+        warmup = np.zeros((self.detect_size[1], self.detect_size[0], 3), dtype=np.uint8)
+        self.face_mesh.process(warmup)
+        self.hands.process(warmup)
+
         print(f"✅ Hybrid Controller Initialized")
         print(f"   Screen: {self.screen_w}x{self.screen_h}")
         print(f"   Mode: {ControlMode(self.control_mode).name}")
@@ -125,33 +288,51 @@ class HybridController:
         print("   's' - Adjust sensitivity")
         print("   'r' - Reset drag mode")
 
-    def detect_blink(self, landmarks):
-        """Detect eye blinks for clicking"""
-        # Left eye landmarks
-        left_top = landmarks[159].y
-        left_bottom = landmarks[145].y
-        left_ratio = abs(left_top - left_bottom)
-
-        # Right eye landmarks
-        right_top = landmarks[386].y
-        right_bottom = landmarks[374].y
-        right_ratio = abs(right_top - right_bottom)
-
-        # Average ratio
-        avg_ratio = (left_ratio + right_ratio) / 2
-        self.blink_history.append(avg_ratio)
+    def _log_drain(self):
+        """Print queued status messages until the None sentinel arrives"""
+        while True:
+            msg = self._log_q.get()
+            if msg is None:
+                break
+            print(msg)
+
+    def _log(self, msg):
+        """Queue a status message for printing without blocking the frame loop"""
+        self._log_q.put_nowait(msg)
+
+    def _capture_loop(self):
+        """Continuously read frames, overwriting the single latest-frame slot"""
+        while self._running:
+            ok, img = self.cap.read()
+            if ok:
+                with self._latest_lock:
+                    self._latest = img
+                    self._latest_id += 1
+
+    def _next_frame(self, last_id):
+        """Wait for a frame newer than last_id and return (frame_id, frame)"""
+        while self._running:
+            with self._latest_lock:
+                if self._latest_id != last_id:
+                    return self._latest_id, self._latest
+            time.sleep(0.001)
+        return last_id, None
+
+    def detect_blink(self, face_lm):
+        """Detect eye blinks for clicking from an (N, 2) face landmark array"""
+        # Average vertical opening of the left (159/145) and right (386/374) eyelids
+        avg_ratio = 0.5 * (abs(face_lm[159, 1] - face_lm[145, 1]) +
+                           abs(face_lm[386, 1] - face_lm[374, 1]))
 
         return avg_ratio < self.blink_threshold
 
-    def get_eye_position(self, landmarks):
+    def get_eye_position(self, face_lm):
         """Get eye position for cursor control - FIXED VERSION"""
-        if len(landmarks) > 475:
+        if len(face_lm) > 475:
             # Use right iris center (landmark 475) - same as working simple_eye_mouse.py
-            iris_center = landmarks[475]
-
             # Convert to screen coordinates with sensitivity (same as working version)
-            raw_x = iris_center.x * self.screen_w * self.eye_sensitivity
-            raw_y = iris_center.y * self.screen_h * self.eye_sensitivity
+            raw_x = float(face_lm[475, 0]) * self.screen_w * self.eye_sensitivity
+            raw_y = float(face_lm[475, 1]) * self.screen_h * self.eye_sensitivity
 
             return raw_x, raw_y
         return None, None
@@ -161,80 +342,53 @@ class HybridController:
         if new_pos[0] is None or new_pos[1] is None:
             return None, None
 
-        self.eye_position_history.append(new_pos)
-
-        if len(self.eye_position_history) < 2:
+        if self._ema is None:
+            self._ema = new_pos
             return new_pos
 
-        # Weighted average smoothing
-        weights = np.linspace(0.2, 1.0, len(self.eye_position_history))
-        weights /= weights.sum()
-
-        smooth_x = sum(w * pos[0] for w, pos in zip(weights, self.eye_position_history))
-        smooth_y = sum(w * pos[1] for w, pos in zip(weights, self.eye_position_history))
+        # Exponential moving average
+        a = self.smoothing_factor
+        self._ema = (a * new_pos[0] + (1 - a) * self._ema[0],
+                     a * new_pos[1] + (1 - a) * self._ema[1])
 
-        return smooth_x, smooth_y
+        return self._ema
 
     def recognize_hand_gesture(self, hand_landmarks):
         """Recognize hand gesture from landmarks"""
         if not hand_landmarks:
             return GestureType.PALM
 
-        # Get finger tip and joint positions
-        landmarks = hand_landmarks.landmark
-
-        # Finger tip landmarks: thumb, index, middle, ring, pinky
-        finger_tips = [4, 8, 12, 16, 20]
-        finger_joints = [3, 6, 10, 14, 18]
-
-        # Check which fingers are extended
-        fingers_up = []
-
-        # Thumb (different logic due to orientation)
-        if landmarks[finger_tips[0]].x > landmarks[finger_joints[0]].x:
-            fingers_up.append(1)
-        else:
-            fingers_up.append(0)
-
-        # Other fingers
-        for i in range(1, 5):
-            if landmarks[finger_tips[i]].y < landmarks[finger_joints[i]].y:
-                fingers_up.append(1)
-            else:
-                fingers_up.append(0)
-
-        # Recognize gestures based on finger states
-        total_fingers = sum(fingers_up)
-
-        if total_fingers == 0:
-            return GestureType.FIST
-        elif total_fingers == 1 and fingers_up[1] == 1:  # Only index
-            return GestureType.INDEX
-        elif total_fingers == 1 and fingers_up[2] == 1:  # Only middle
-            return GestureType.MIDDLE
-        elif total_fingers == 2 and fingers_up[1] == 1 and fingers_up[2] == 1:  # Index + middle
-            return GestureType.PEACE
-        elif total_fingers == 1 and fingers_up[0] == 1:  # Only thumb
-            return GestureType.THUMBS_UP
-        elif total_fingers == 5:
-            return GestureType.PALM
-        else:
-            # Check for pinch gesture
-            thumb_index_dist = math.sqrt(
-                (landmarks[4].x - landmarks[8].x)**2 +
-                (landmarks[4].y - landmarks[8].y)**2
-            )
-            if thumb_index_dist < 0.05:
-                return GestureType.PINCH
-
-        return GestureType.PALM
-
-    def execute_gesture_action(self, gesture):
-        """Execute action based on recognized gesture"""
-        current_time = time.time()
+        return GestureType(_recognize(_landmarks_to_xy(hand_landmarks.landmark)))
+
+    def _vote_gesture(self, hand_landmarks, now):
+        """Add one detection's gesture to the vote window and act on a change of majority"""
+        gesture = self.recognize_hand_gesture(hand_landmarks)
+
+        # Slide the vote window: drop the oldest vote, add the new one
+        if len(self.gesture_history) == self.gesture_history.maxlen:
+            self._gesture_counts[self.gesture_history[0]] -= 1
+        self.gesture_history.append(gesture)
+        self._gesture_counts[gesture] += 1
+
+        # Stabilize gesture recognition
+        if len(self.gesture_history) >= 3:
+            # Use most common gesture in recent history; with three different
+            # votes there is no majority, so keep the current gesture
+            top = int(self._gesture_counts.argmax())
+            stable_gesture = (GestureType(top) if self._gesture_counts[top] >= 2
+                              else self.current_gesture)
+
+            if stable_gesture != self.current_gesture:
+                self.current_gesture = stable_gesture
+
+                # Execute gesture action
+                if self.current_gesture != GestureType.PALM:
+                    self.execute_gesture_action(self.current_gesture, now)
 
+    def execute_gesture_action(self, gesture, now):
+        """Execute action based on recognized gesture"""
         # Check cooldown
-        if current_time - self.last_gesture_time < self.gesture_cooldown:
+        if now - self.last_gesture_time < self.gesture_cooldown:
             return
 
         success = False
@@ -243,47 +397,47 @@ class HybridController:
             if gesture == GestureType.INDEX:
                 # Left click
                 pyautogui.click()
-                print("🖱️ Left Click")
+                self._log("🖱️ Left Click")
                 success = True
-                self.last_gesture_time = current_time
+                self.last_gesture_time = now
 
             elif gesture == GestureType.MIDDLE:
                 # Right click
                 pyautogui.rightClick()
-                print("🖱️ Right Click")
+                self._log("🖱️ Right Click")
                 success = True
-                self.last_gesture_time = current_time
+                self.last_gesture_time = now
 
             elif gesture == GestureType.PEACE:
                 # Double click
                 pyautogui.doubleClick()
-                print("🖱️ Double Click")
+                self._log("🖱️ Double Click")
                 success = True
-                self.last_gesture_time = current_time
+                self.last_gesture_time = now
 
             elif gesture == GestureType.FIST:
                 # Toggle drag mode
                 self.drag_mode = not self.drag_mode
                 if self.drag_mode:
                     pyautogui.mouseDown()
-                    print("🔒 Drag Mode ON")
+                    self._log("🔒 Drag Mode ON")
                 else:
                     pyautogui.mouseUp()
-                    print("🔓 Drag Mode OFF")
+                    self._log("🔓 Drag Mode OFF")
                 success = True
-                self.last_gesture_time = current_time
+                self.last_gesture_time = now
 
             elif gesture == GestureType.THUMBS_UP:
                 # Toggle control mode
                 self.control_mode = (self.control_mode + 1) % 3
                 mode_name = ControlMode(self.control_mode).name
-                print(f"🔄 Mode: {mode_name}")
+                self._log(f"🔄 Mode: {mode_name}")
                 success = True
-                self.last_gesture_time = current_time
+                self.last_gesture_time = now
 
             elif gesture == GestureType.PINCH:
                 # Scroll (placeholder - would need position tracking)
-                print("📜 Scroll gesture detected")
+                self._log("📜 Scroll gesture detected")
                 success = True
 
         except Exception as e:
@@ -295,15 +449,12 @@ class HybridController:
 
     def record_gesture_attempt(self, gesture, success):
         """Record gesture attempt for reinforcement learning"""
-        if gesture not in self.gesture_attempts:
-            self.gesture_attempts[gesture] = 0
-            self.gesture_success_rates[gesture] = 0.5
-
         self.gesture_attempts[gesture] += 1
 
-        # Update success rate
+        # Update success rate (exponential moving average towards the reward)
+        reward = 1.0 if success else 0.0
         current_rate = self.gesture_success_rates[gesture]
-        new_rate = current_rate + self.learning_rate * (1.0 if success else 0.0 - current_rate)
+        new_rate = current_rate + self.learning_rate * (reward - current_rate)
         self.gesture_success_rates[gesture] = max(0.1, min(0.9, new_rate))
 
     def load_learning_data(self):
@@ -311,42 +462,60 @@ class HybridController:
         try:
             with open('hybrid_learning.json', 'r') as f:
                 data = json.load(f)
-                self.gesture_success_rates = data.get('success_rates', {})
-                self.gesture_attempts = data.get('attempts', {})
+                _fill_per_gesture(self.gesture_success_rates, data.get('success_rates', []))
+                _fill_per_gesture(self.gesture_attempts, data.get('attempts', []))
         except FileNotFoundError:
             logging.info("No previous learning data found")
 
     def save_learning_data(self):
         """Save reinforcement learning data"""
         data = {
-            'success_rates': self.gesture_success_rates,
-            'attempts': self.gesture_attempts
+            'success_rates': self.gesture_success_rates.tolist(),
+            'attempts': self.gesture_attempts.tolist()
         }
-        with open('hybrid_learning.json', 'w') as f:
+
+        # Write to a temporary file and swap it in so a crash can't truncate the data
+        tmp_path = 'hybrid_learning.json.tmp'
+        with open(tmp_path, 'w') as f:
             json.dump(data, f)
+        os.replace(tmp_path, 'hybrid_learning.json')
+
+    def _render_ui_labels(self):
+        """Pre-render the static status labels and record where each value starts"""
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        widths = [cv2.getTextSize(label, font, 0.6, 2)[0][0] for label in UI_LABELS]
 
-    def draw_ui_info(self, image):
+        labels = np.zeros((30 + len(UI_LABELS) * 25, 10 + max(widths) + 4, 3), dtype=np.uint8)
+        for i, label in enumerate(UI_LABELS):
+            cv2.putText(labels, label, (10, 30 + i * 25), font, 0.6, (0, 255, 0), 2)
+
+        self._ui_labels = labels
+        self._ui_labels_mask = labels.any(axis=2, keepdims=True)
+        self._ui_value_x = [10 + w + 8 for w in widths]
+
+    def draw_ui_info(self, image, now):
         """Draw UI information on the image"""
         h, w, _ = image.shape
 
         # Performance info
-        current_time = time.time()
-        elapsed = current_time - self.start_time
+        elapsed = now - self.start_time
         fps = self.frame_count / elapsed if elapsed > 0 else 0
 
-        # Status information
-        status_lines = [
-            f"FPS: {fps:.1f}",
-            f"Mode: {ControlMode(self.control_mode).name}",
-            f"Gesture: {GestureType(self.current_gesture).name}",
-            f"Drag: {'ON' if self.drag_mode else 'OFF'}",
-            f"Eye Sens: {self.eye_sensitivity:.1f}",
-            f"Frames: {self.frame_count}"
+        # Status values (labels come from the pre-rendered strip)
+        status_values = [
+            f"{fps:.1f}",
+            ControlMode(self.control_mode).name,
+            GestureType(self.current_gesture).name,
+            'ON' if self.drag_mode else 'OFF',
+            f"{self.eye_sensitivity:.1f}",
+            f"{self.frame_count}"
         ]
 
         # Draw status
-        for i, line in enumerate(status_lines):
-            cv2.putText(image, line, (10, 30 + i * 25),
+        label_h, label_w, _ = self._ui_labels.shape
+        np.copyto(image[:label_h, :label_w], self._ui_labels, where=self._ui_labels_mask)
+        for i, (x, value) in enumerate(zip(self._ui_value_x, status_values)):
+            cv2.putText(image, value, (x, 30 + i * 25),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
 
         # Draw crosshair at center for eye tracking reference
@@ -362,116 +531,145 @@ class HybridController:
         print("   Look around to move cursor (eye mode)")
         print("   Use hand gestures for actions")
 
+        frame_id = 0
+
         try:
             while True:
-                success, image = self.cap.read()
-                if not success:
-                    continue
+                frame_id, image = self._next_frame(frame_id)
+                if image is None:
+                    break
+
+                # One monotonic timestamp per frame for cooldowns and FPS
+                now = time.monotonic()
 
                 # Flip image horizontally for mirror effect
                 image = cv2.flip(image, 1)
 
-                # Convert BGR to RGB for MediaPipe
-                rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                rgb_image.flags.writeable = False
-
-                # Process face and hands
-                face_results = self.face_mesh.process(rgb_image)
-                hand_results = self.hands.process(rgb_image)
-
-                # Convert back to BGR
-                rgb_image.flags.writeable = True
-                image = cv2.cvtColor(rgb_image, cv2.COLOR_RGB2BGR)
+                # Only run the detectors every detect_stride frames
+                phase = self._frame_idx % self.detect_stride
+                self._frame_idx += 1
+                detect = phase == 0 or self._last_face_results is None
+
+                if detect:
+                    # MediaPipe gets a downscaled RGB copy; landmarks come back normalized,
+                    # so the untouched full-size BGR frame is used directly for display
+                    small = cv2.resize(image, self.detect_size, interpolation=cv2.INTER_AREA)
+                    # BGR -> RGB as a reversed channel view, made contiguous in a single copy
+                    rgb_image = np.ascontiguousarray(small[:, :, ::-1])
+                    rgb_image.flags.writeable = False
+
+                    # Process face and hands in parallel (both only read rgb_image);
+                    # a model whose output the current mode ignores is skipped
+                    face_future = hand_future = None
+                    if self.control_mode != ControlMode.GESTURE_ONLY:
+                        face_future = self._pool.submit(self.face_mesh.process, rgb_image)
+                    if self.control_mode != ControlMode.EYE_ONLY:
+                        hand_future = self._pool.submit(self.hands.process, rgb_image)
+                    face_results = face_future.result() if face_future else _NO_RESULTS
+                    hand_results = hand_future.result() if hand_future else _NO_RESULTS
+
+                    self._last_face_results = face_results
+                    self._last_hand_results = hand_results
+
+                    # Pull face landmarks into one array per detection
+                    if face_results.multi_face_landmarks:
+                        self._face_lm = _landmarks_to_xy(face_results.multi_face_landmarks[0].landmark)
+                    else:
+                        # Face lost, or its model skipped in this mode: drop the stale motion
+                        self._face_lm = None
+                        self._last_eye_raw = None
+                        self._eye_velocity = (0.0, 0.0)
+                else:
+                    face_results = self._last_face_results
+                    hand_results = self._last_hand_results
 
                 # Process eye tracking - EXACT SAME AS SIMPLE_EYE_MOUSE.PY
                 if (face_results.multi_face_landmarks and
                     self.control_mode in [ControlMode.EYE_ONLY, ControlMode.HYBRID]):
 
-                    landmarks = face_results.multi_face_landmarks[0].landmark
+                    face_lm = self._face_lm
 
                     # EXACT SAME METHOD AS simple_eye_mouse.py
-                    if len(landmarks) > 475:
-                        iris_center = landmarks[475]  # Right iris center
-
-                        # Convert to screen coordinates
-                        raw_x = iris_center.x * self.screen_w * self.eye_sensitivity
-                        raw_y = iris_center.y * self.screen_h * self.eye_sensitivity
+                    if len(face_lm) > 475:
+                        if detect:
+                            # Right iris center in screen coordinates
+                            raw_x, raw_y = self.get_eye_position(face_lm)
+
+                            # Per-frame velocity between consecutive detections
+                            if self._last_eye_raw is not None:
+                                self._eye_velocity = (
+                                    (raw_x - self._last_eye_raw[0]) / self.detect_stride,
+                                    (raw_y - self._last_eye_raw[1]) / self.detect_stride
+                                )
+                            self._last_eye_raw = (raw_x, raw_y)
+                        elif self._last_eye_raw is not None:
+                            # Extrapolate from the last detection
+                            raw_x = self._last_eye_raw[0] + self._eye_velocity[0] * phase
+                            raw_y = self._last_eye_raw[1] + self._eye_velocity[1] * phase
+                        else:
+                            raw_x, raw_y = self.get_eye_position(face_lm)
 
                         # Clamp to screen bounds
                         screen_x = max(0, min(self.screen_w - 1, int(raw_x)))
                         screen_y = max(0, min(self.screen_h - 1, int(raw_y)))
 
-                        # Move cursor directly (EXACT SAME AS simple_eye_mouse.py)
-                        pyautogui.moveTo(screen_x, screen_y)
+                        # Move cursor directly, skipping writes that wouldn't change it
+                        if (screen_x, screen_y) != self._last_xy:
+                            self._move(screen_x, screen_y)
+                            self._last_xy = (screen_x, screen_y)
 
                     # Detect blinks for clicking (eye-only mode)
                     if self.control_mode == ControlMode.EYE_ONLY:
-                        current_time = time.time()
-                        if (self.detect_blink(landmarks) and
-                            current_time - self.last_blink_time > self.blink_cooldown):
+                        if (self.detect_blink(face_lm) and
+                            now - self.last_blink_time > self.blink_cooldown):
 
                             pyautogui.click()
-                            self.last_blink_time = current_time
-                            print("😉 Blink Click!")
+                            self.last_blink_time = now
+                            self._log("😉 Blink Click!")
 
                 # Process hand gestures
                 if (hand_results.multi_hand_landmarks and
                     self.control_mode in [ControlMode.GESTURE_ONLY, ControlMode.HYBRID]):
 
                     for hand_landmarks in hand_results.multi_hand_landmarks:
-                        # Recognize gesture
-                        gesture = self.recognize_hand_gesture(hand_landmarks)
-                        self.gesture_history.append(gesture)
-
-                        # Stabilize gesture recognition
-                        if len(self.gesture_history) >= 3:
-                            # Use most common gesture in recent history
-                            gesture_counts = {}
-                            for g in list(self.gesture_history)[-3:]:
-                                gesture_counts[g] = gesture_counts.get(g, 0) + 1
-
-                            stable_gesture = max(gesture_counts, key=gesture_counts.get)
-
-                            if stable_gesture != self.current_gesture:
-                                self.current_gesture = stable_gesture
-
-                                # Execute gesture action
-                                if self.current_gesture != GestureType.PALM:
-                                    self.execute_gesture_action(self.current_gesture)
+                        # Only fresh detections vote; reused results are just drawn again
+                        if detect:
+                            self._vote_gesture(hand_landmarks, now)
 
                         # Draw hand landmarks
                         self.mp_drawing.draw_landmarks(
                             image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
 
                 # Draw UI information
-                image = self.draw_ui_info(image)
+                image = self.draw_ui_info(image, now)
 
                 # Display image
                 cv2.imshow('Hybrid Eye + Gesture Controller', image)
 
                 # Handle keyboard input
-                key = cv2.waitKey(1) & 0xFF
+                key = self._poll_key() & 0xFF
                 if key == ord('q') or key == 27:  # 'q' or ESC
                     break
                 elif key == ord('m'):
                     # Toggle control mode
                     self.control_mode = (self.control_mode + 1) % 3
                     mode_name = ControlMode(self.control_mode).name
-                    print(f"🔄 Mode: {mode_name}")
+                    self._log(f"🔄 Mode: {mode_name}")
                 elif key == ord('s'):
                     # Adjust eye sensitivity
                     self.eye_sensitivity = (self.eye_sensitivity + 0.2) % 3.0 + 0.5
-                    print(f"👁️ Eye Sensitivity: {self.eye_sensitivity:.1f}")
+                    self._log(f"👁️ Eye Sensitivity: {self.eye_sensitivity:.1f}")
                 elif key == ord('r'):
                     # Reset drag mode
                     if self.drag_mode:
                         pyautogui.mouseUp()
                         self.drag_mode = False
-                        print("🔓 Drag Mode Reset")
+                        self._log("🔓 Drag Mode Reset")
                 elif key == ord(' '):
                     # Center cursor
-                    pyautogui.moveTo(self.screen_w // 2, self.screen_h // 2)
-                    print("🎯 Cursor Centered")
+                    self._last_xy = (self.screen_w // 2, self.screen_h // 2)
+                    self._move(*self._last_xy)
+                    self._log("🎯 Cursor Centered")
 
                 self.frame_count += 1
 
@@ -482,29 +680,40 @@ class HybridController:
 
     def cleanup(self):
         """Clean up resources"""
+        # Flush queued status messages before the final output
+        self._log_q.put(None)
+        self._log_thread.join(timeout=1.0)
+
         print("🧹 Cleaning up...")
 
         # Release mouse if in drag mode
         if self.drag_mode:
             pyautogui.mouseUp()
 
+        # Stop inference workers
+        self._pool.shutdown(wait=True)
+
         # Save learning data
         self.save_learning_data()
 
+        # Stop the capture thread before releasing the camera
+        self._running = False
+        self._capture_thread.join(timeout=1.0)
+
         # Release camera and close windows
         if self.cap:
             self.cap.release()
         cv2.destroyAllWindows()
 
         # Final statistics
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         avg_fps = self.frame_count / elapsed if elapsed > 0 else 0
 
         print(f"📊 Session Statistics:")
         print(f"   Runtime: {elapsed:.1f}s")
         print(f"   Frames: {self.frame_count}")
         print(f"   Average FPS: {avg_fps:.1f}")
-        print(f"   Gesture attempts: {sum(self.gesture_attempts.values())}")
+        print(f"   Gesture attempts: {int(self.gesture_attempts.sum())}")
         print("✅ Cleanup completed")
 
 def main():
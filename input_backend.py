@@ -0,0 +1,173 @@
+"""
+Native Input Backend
+Sends cursor moves, clicks and scrolls straight to the OS, bypassing PyAutoGUI's wrapper stack
+"""
+
+import sys
+import logging
+import pyautogui
+
+BACKEND = "pyautogui"
+
+def _pyautogui_backend():
+    """PyAutoGUI fallback - used when no native backend is available"""
+    def move_to(x: int, y: int):
+        pyautogui.moveTo(x, y, _pause=False)
+
+    def click(button: str = "left"):
+        pyautogui.click(button=button, _pause=False)
+
+    def scroll(clicks: int):
+        pyautogui.scroll(clicks, _pause=False)
+
+    def hscroll(clicks: int):
+        pyautogui.hscroll(clicks, _pause=False)
+
+    return move_to, click, scroll, hscroll
+
+def _windows_backend():
+    """SetCursorPos for moves, SendInput with prebuilt INPUT structs for buttons"""
+    import ctypes
+    from ctypes import wintypes
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                    ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD),
+                    ("dwExtraInfo", ctypes.POINTER(wintypes.ULONG))]
+
+    class INPUT(ctypes.Structure):
+        class _INPUT(ctypes.Union):
+            _fields_ = [("mi", MOUSEINPUT)]
+        _anonymous_ = ("u",)
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUT)]
+
+    INPUT_MOUSE = 0
+    MOUSEEVENTF_WHEEL = 0x0800
+    MOUSEEVENTF_HWHEEL = 0x1000
+    button_flags = {"left": (0x0002, 0x0004), "right": (0x0008, 0x0010), "middle": (0x0020, 0x0040)}
+
+    user32 = ctypes.windll.user32
+    set_cursor_pos = user32.SetCursorPos
+    send_input = user32.SendInput
+    input_size = ctypes.sizeof(INPUT)
+
+    # Down/up pairs are built once and reused for every click
+    clicks = {}
+    for name, (down, up) in button_flags.items():
+        pair = (INPUT * 2)()
+        pair[0].type = pair[1].type = INPUT_MOUSE
+        pair[0].mi.dwFlags = down
+        pair[1].mi.dwFlags = up
+        clicks[name] = pair
+
+    wheel = INPUT(type=INPUT_MOUSE)
+    wheel_ref = ctypes.byref(wheel)
+
+    def move_to(x: int, y: int):
+        set_cursor_pos(int(x), int(y))
+
+    def click(button: str = "left"):
+        send_input(2, clicks[button], input_size)
+
+    # Same raw wheel units PyAutoGUI sends on Windows
+    def scroll(amount: int):
+        wheel.mi.dwFlags = MOUSEEVENTF_WHEEL
+        wheel.mi.mouseData = amount & 0xFFFFFFFF
+        send_input(1, wheel_ref, input_size)
+
+    def hscroll(amount: int):
+        wheel.mi.dwFlags = MOUSEEVENTF_HWHEEL
+        wheel.mi.mouseData = amount & 0xFFFFFFFF
+        send_input(1, wheel_ref, input_size)
+
+    return move_to, click, scroll, hscroll
+
+def _x11_backend():
+    """Pointer warps and XTest fake button events on a single display connection"""
+    from Xlib import X, display as xdisplay
+    from Xlib.ext import xtest
+
+    disp = xdisplay.Display()
+    root = disp.screen().root
+    buttons = {"left": 1, "middle": 2, "right": 3}
+
+    def press(button: int, times: int = 1):
+        for _ in range(times):
+            xtest.fake_input(disp, X.ButtonPress, button)
+            xtest.fake_input(disp, X.ButtonRelease, button)
+        disp.sync()
+
+    def move_to(x: int, y: int):
+        root.warp_pointer(int(x), int(y))
+        disp.sync()
+
+    def click(button: str = "left"):
+        press(buttons[button])
+
+    # Buttons 4-7 are the wheel, one press per scroll click as PyAutoGUI does
+    def scroll(amount: int):
+        press(4 if amount > 0 else 5, abs(amount))
+
+    def hscroll(amount: int):
+        press(7 if amount > 0 else 6, abs(amount))
+
+    return move_to, click, scroll, hscroll
+
+def _quartz_backend():
+    """Quartz CGEventPost for moves, clicks and line-based scrolling"""
+    import Quartz
+
+    button_events = {
+        "left": (Quartz.kCGEventLeftMouseDown, Quartz.kCGEventLeftMouseUp, Quartz.kCGMouseButtonLeft),
+        "right": (Quartz.kCGEventRightMouseDown, Quartz.kCGEventRightMouseUp, Quartz.kCGMouseButtonRight),
+        "middle": (Quartz.kCGEventOtherMouseDown, Quartz.kCGEventOtherMouseUp, Quartz.kCGMouseButtonCenter),
+    }
+    tap = Quartz.kCGHIDEventTap
+
+    def post_mouse(event_type, position, button):
+        Quartz.CGEventPost(tap, Quartz.CGEventCreateMouseEvent(None, event_type, position, button))
+
+    def move_to(x: int, y: int):
+        post_mouse(Quartz.kCGEventMouseMoved, (x, y), Quartz.kCGMouseButtonLeft)
+
+    def click(button: str = "left"):
+        down, up, mouse_button = button_events[button]
+        position = Quartz.CGEventGetLocation(Quartz.CGEventCreate(None))
+        post_mouse(down, position, mouse_button)
+        post_mouse(up, position, mouse_button)
+
+    def scroll(amount: int):
+        Quartz.CGEventPost(tap, Quartz.CGEventCreateScrollWheelEvent(
+            None, Quartz.kCGScrollEventUnitLine, 1, amount))
+
+    def hscroll(amount: int):
+        Quartz.CGEventPost(tap, Quartz.CGEventCreateScrollWheelEvent(
+            None, Quartz.kCGScrollEventUnitLine, 2, 0, amount))
+
+    return move_to, click, scroll, hscroll
+
+def _select_backend():
+    """Pick the native backend for this platform, falling back to PyAutoGUI"""
+    global BACKEND
+
+    if sys.platform == 'win32':
+        candidates = [("sendinput", _windows_backend)]
+    elif sys.platform == 'darwin':
+        candidates = [("quartz", _quartz_backend)]
+    elif sys.platform.startswith('linux'):
+        candidates = [("xtest", _x11_backend)]
+    else:
+        candidates = []
+
+    for name, factory in candidates:
+        try:
+            functions = factory()
+            BACKEND = name
+            logging.info(f"Using {name} input backend")
+            return functions
+        except Exception as e:
+            logging.warning(f"{name} input backend unavailable, using pyautogui: {e}")
+
+    return _pyautogui_backend()
+
+move_to, click, scroll, hscroll = _select_backend()
@@ -3,14 +3,20 @@ Main Application for Eye-Controlled Computer Interface
 Comprehensive eye tracking system with streaming platform optimizations
 """
 
+import os
 import sys
 import threading
+import queue
 import time
 import logging
+import logging.handlers
+import atexit
 import traceback
+from collections import deque
 from typing import Dict, Any, List
 import tkinter as tk
 from tkinter import messagebox
+import numpy as np
 import pyautogui
 
 # Import our modules
@@ -26,19 +32,61 @@ except ImportError:
 from gesture_controller import GestureController
 from ui_overlay import EyeTrackingOverlay
 from performance_monitor import PerformanceMonitor
-from streaming_plugins.netflix_plugin import NetflixPlugin
-from streaming_plugins.youtube_plugin import YouTubePlugin
-from streaming_plugins.base_plugin import StreamingPlugin
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('eye_tracking.log'),
-        logging.StreamHandler()
-    ]
-)
+
+# Configure logging - records are queued and written by a listener thread so
+# logging from the tracking threads never waits on file I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('eye_tracking.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+# force=True replaces the default handler installed by any module that logged on import
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)], force=True)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+def _make_foreground_window_getter():
+    """Return a callable giving the focused window's id, or None when unsupported"""
+    if sys.platform == 'win32':
+        try:
+            import win32gui
+            return win32gui.GetForegroundWindow
+        except ImportError:
+            pass
+    elif sys.platform.startswith('linux'):
+        try:
+            from Xlib import X, display as xdisplay
+            root = xdisplay.Display().screen().root
+            active_atom = root.display.intern_atom('_NET_ACTIVE_WINDOW')
+
+            def get_foreground_window():
+                prop = root.get_full_property(active_atom, X.AnyPropertyType)
+                return prop.value[0] if prop else None
+
+            return get_foreground_window
+        except Exception as e:
+            logging.debug(f"Foreground window tracking unavailable: {e}")
+
+    return None
+
+def _pin_current_thread(cores: List[int]):
+    """Restrict the calling thread to the given CPU cores"""
+    if hasattr(os, "sched_setaffinity"):
+        # pid 0 is the calling thread on Linux
+        os.sched_setaffinity(0, cores)
+    elif sys.platform == 'win32':
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        mask = sum(1 << core for core in cores)
+        if not kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), mask):
+            raise OSError(f"SetThreadAffinityMask failed for mask {mask:#x}")
+    else:
+        raise OSError("thread affinity is not supported on this platform")
 
 class EyeControlledInterface:
     def __init__(self):
@@ -60,9 +108,17 @@ class EyeControlledInterface:
             self.gesture_controller = GestureController(self.config)
             self.performance_monitor = PerformanceMonitor(self.config)
 
-            # Initialize streaming plugins
+            # Streaming plugins are imported and loaded on first start_tracking
             self.streaming_plugins = []
-            self.load_streaming_plugins()
+            self._plugins_loaded = False
+
+            # Platform detection scans the process list, so it runs on a timer
+            # instead of once per frame, and only rescans when focus changes
+            self._active_plugin_idx = -1
+            self._plugin_timer = None
+            self._get_foreground_window = _make_foreground_window_getter()
+            self._last_foreground_window = None
+            self._last_plugin_scan = 0.0
 
             # Initialize UI
             self.ui = EyeTrackingOverlay(self.config, self.eye_tracker, self.gesture_controller)
@@ -72,14 +128,31 @@ class EyeControlledInterface:
                 on_calibrate=self.start_calibration
             )
 
+            # Tk is not thread-safe - the tracking thread hands results to the
+            # Tk main loop, which only ever draws the newest frame
+            self._ui_frames = deque(maxlen=1)
+            self._gesture_events = deque(maxlen=64)
+            self.ui.root.after(16, self._drain_ui_events)
+
             # Tracking state
             self.is_running = False
+            self._stop_event = threading.Event()  # Wakes waiting pipeline threads on stop
             self.tracking_thread = None
-            self.calibration_thread = None
+            self.capture_thread = None
+            self.detect_thread = None
+            self.plugin_thread = None
+            self._calibration_points = None  # Set while a calibration is in progress
+
+            # Pipeline stages hand over only the newest item (capture -> detect -> gesture/UI)
+            self.capture_queue = queue.Queue(maxsize=1)
+            self.detect_queue = queue.Queue(maxsize=1)
+
+            # Streaming plugins run off the tracking thread; work is dropped when they fall behind
+            self.plugin_queue = queue.Queue(maxsize=2)
 
             # Performance monitoring
             self.frame_count = 0
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
 
             logging.info("Eye-controlled interface initialized successfully")
 
@@ -90,7 +163,12 @@ class EyeControlledInterface:
 
     def load_streaming_plugins(self):
         """Load and initialize streaming platform plugins"""
+        self._plugins_loaded = True
+
         try:
+            from streaming_plugins.netflix_plugin import NetflixPlugin
+            from streaming_plugins.youtube_plugin import YouTubePlugin
+
             # Load Netflix plugin
             netflix_plugin = NetflixPlugin(self.config)
             self.streaming_plugins.append(netflix_plugin)
@@ -116,13 +194,28 @@ class EyeControlledInterface:
                 return
 
             self.is_running = True
+            self._stop_event.clear()
 
             # Start performance monitoring
             self.performance_monitor.start_monitoring()
 
-            # Start tracking thread
+            # Start streaming platform detection
+            if not self._plugins_loaded:
+                self.load_streaming_plugins()
+            self._refresh_active_plugin()
+
+            # Optional per-stage CPU pinning, e.g. {"detect": [2], "capture": [1]}
+            self._core_pins = self.config.get_setting("performance", "core_pins", {}) or {}
+
+            # Start pipeline threads
+            self.capture_thread = threading.Thread(target=self.capture_loop, daemon=True)
+            self.detect_thread = threading.Thread(target=self.detect_loop, daemon=True)
             self.tracking_thread = threading.Thread(target=self.tracking_loop, daemon=True)
+            self.plugin_thread = threading.Thread(target=self.plugin_loop, daemon=True)
+            self.capture_thread.start()
+            self.detect_thread.start()
             self.tracking_thread.start()
+            self.plugin_thread.start()
 
             # Update UI status
             self.ui.connection_label.config(text="Camera: Connected")
@@ -140,10 +233,23 @@ class EyeControlledInterface:
             return
 
         self.is_running = False
-
-        # Wait for tracking thread to finish
-        if self.tracking_thread and self.tracking_thread.is_alive():
-            self.tracking_thread.join(timeout=2.0)
+        self._stop_event.set()
+
+        if self._plugin_timer:
+            self._plugin_timer.cancel()
+
+        # Wait for pipeline threads to finish
+        for thread in (self.capture_thread, self.detect_thread, self.tracking_thread, self.plugin_thread):
+            if thread and thread.is_alive():
+                thread.join(timeout=2.0)
+
+        # Drop frames left over for the next session
+        for stage_queue in (self.capture_queue, self.detect_queue, self.plugin_queue):
+            while True:
+                try:
+                    stage_queue.get_nowait()
+                except queue.Empty:
+                    break
 
         # Stop performance monitoring
         self.performance_monitor.stop_monitoring()
@@ -156,145 +262,313 @@ class EyeControlledInterface:
 
         logging.info("Eye tracking stopped")
 
-    def tracking_loop(self):
-        """Main tracking loop - runs in separate thread"""
+    @staticmethod
+    def _put_latest(stage_queue: queue.Queue, item):
+        """Hand an item to the next stage, evicting the one it has not picked up yet"""
         try:
-            while self.is_running:
-                start_time = time.time()
+            stage_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                stage_queue.get_nowait()
+            except queue.Empty:
+                pass
+            stage_queue.put_nowait(item)
+
+    def _pin_stage(self, stage: str):
+        """Pin the calling pipeline thread to the cores configured for its stage"""
+        cores = self._core_pins.get(stage)
+        if not cores:
+            return
 
-                # Process frame
-                frame, tracking_data = self.eye_tracker.process_frame()
+        try:
+            _pin_current_thread(cores)
+            logging.info(f"Pinned {stage} thread to cores {cores}")
+        except Exception as e:
+            logging.warning(f"Could not pin {stage} thread to cores {cores}: {e}")
+
+    def capture_loop(self):
+        """Capture stage - reads camera frames at the target frame rate"""
+        self._pin_stage("capture")
+
+        try:
+            # Frame pacing is read once; it is only re-read when the performance
+            # monitor switches quality level (which rewrites tracking.frame_rate)
+            quality_level = self.performance_monitor.current_quality_level
+            target_frame_time = 1.0 / self.config.get_setting("tracking", "frame_rate", 30)
+            deadline = time.perf_counter()
+            behind = False
+
+            while self.is_running:
+                # After an overrun, skip the frames that queued up meanwhile
+                frame = self.eye_tracker.capture_frame(latest_only=behind)
 
                 if frame is not None:
-                    # Update video display
-                    self.ui.update_video_display(frame)
+                    self._put_latest(self.capture_queue, (frame, time.perf_counter()))
+
+                    if self.performance_monitor.current_quality_level != quality_level:
+                        quality_level = self.performance_monitor.current_quality_level
+                        target_frame_time = 1.0 / self.config.get_setting("tracking", "frame_rate", 30)
+
+                    # Maintain target frame rate against an absolute deadline
+                    deadline += target_frame_time
+                    slack = deadline - time.perf_counter()
+                    behind = slack <= 0
+                    if not behind:
+                        self._stop_event.wait(slack)
+                    else:
+                        # Running behind - resync instead of trying to catch up
+                        deadline = time.perf_counter()
 
-                    # Update tracking status
-                    self.ui.update_tracking_status(tracking_data)
+                else:
+                    # No frame available, short delay (cut short by stop_tracking)
+                    self._stop_event.wait(0.01)
+                    deadline = time.perf_counter()
 
-                    # Process gestures if eye position is available
-                    if tracking_data.get("eye_position"):
-                        gesture_actions = self.gesture_controller.process_tracking_data(tracking_data)
+        except Exception as e:
+            logging.error(f"Error in capture loop: {e}")
+            logging.error(traceback.format_exc())
+            self.is_running = False
 
-                        # Process streaming platform gestures
-                        streaming_actions = self.process_streaming_platforms(tracking_data)
-                        gesture_actions.extend(streaming_actions)
+    def detect_loop(self):
+        """Detect stage - runs landmark detection while the next frame is captured"""
+        self._pin_stage("detect")
 
-                        # Update UI with gesture events
-                        for action in gesture_actions:
-                            self.ui.add_gesture_event(action)
+        try:
+            while self.is_running:
+                try:
+                    frame, captured_at = self.capture_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
 
-                    # Performance monitoring
-                    self.frame_count += 1
-                    processing_time = time.time() - start_time
+                tracking_data = self.eye_tracker.analyze_frame(frame)
+                self._put_latest(self.detect_queue, (frame, tracking_data, captured_at))
 
-                    # Update performance monitor
-                    fps = 1.0 / processing_time if processing_time > 0 else 0
-                    self.performance_monitor.update_fps(fps)
-                    self.performance_monitor.update_latency(processing_time * 1000)  # Convert to ms
+        except Exception as e:
+            logging.error(f"Error in detect loop: {e}")
+            logging.error(traceback.format_exc())
+            self.is_running = False
 
-                    # Maintain target frame rate
-                    target_fps = self.config.get_setting("tracking", "frame_rate", 30)
-                    target_frame_time = 1.0 / target_fps
+    def tracking_loop(self):
+        """Gesture and UI stage - consumes detection results from detect_loop"""
+        self._pin_stage("tracking")
 
-                    if processing_time < target_frame_time:
-                        time.sleep(target_frame_time - processing_time)
+        try:
+            last_frame_time = time.perf_counter()
 
-                else:
-                    # No frame available, short delay
-                    time.sleep(0.01)
+            while self.is_running:
+                try:
+                    frame, tracking_data, captured_at = self.detect_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                # Hand the frame to the UI thread (replaces any frame not yet drawn)
+                self._ui_frames.append((frame, tracking_data))
+
+                # Process gestures if eye position is available
+                eye_position = tracking_data.eye_position
+                if eye_position:
+                    gesture_actions = self.gesture_controller.process_tracking_data(tracking_data)
+
+                    # Queue gesture events for the UI thread
+                    self._gesture_events.extend(gesture_actions)
+
+                    # Hand streaming platform gestures to plugin_loop (tracking_data is not
+                    # modified after this point, so it is shared rather than copied)
+                    if self._active_plugin_idx >= 0:
+                        try:
+                            self.plugin_queue.put_nowait((eye_position, tracking_data))
+                        except queue.Full:
+                            pass
+
+                # Performance monitoring
+                self.frame_count += 1
+                now = time.perf_counter()
+                frame_interval = now - last_frame_time
+                last_frame_time = now
+
+                # Update performance monitor - latency spans capture to gesture dispatch
+                self.performance_monitor.record_frame(frame_interval, (now - captured_at) * 1000)  # Convert to ms
 
         except Exception as e:
             logging.error(f"Error in tracking loop: {e}")
             logging.error(traceback.format_exc())
             self.is_running = False
 
-    def process_streaming_platforms(self, tracking_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Process streaming platform specific gestures"""
-        actions = []
+    def plugin_loop(self):
+        """Streaming plugin stage - keeps slow plugin actions off the tracking thread"""
+        self._pin_stage("plugin")
+
+        while self.is_running:
+            try:
+                eye_position, tracking_data = self.plugin_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # Process streaming platform gestures
+            streaming_actions = self.process_streaming_platforms(eye_position, tracking_data)
+
+            # Queue gesture events for the UI thread
+            self._gesture_events.extend(streaming_actions)
 
+    def _drain_ui_events(self):
+        """Apply tracking results to the widgets - runs on the Tk main loop"""
         try:
-            eye_position = tracking_data.get("eye_position")
-            if not eye_position:
-                return actions
+            if self._ui_frames:
+                frame, tracking_data = self._ui_frames.pop()
 
-            # Check each streaming plugin
-            for plugin in self.streaming_plugins:
-                if plugin.is_platform_active():
-                    plugin_actions = plugin.process_streaming_gestures(eye_position, tracking_data)
-                    actions.extend(plugin_actions)
+                # Update video display
+                self.ui.update_video_display(frame)
 
-                    # Only process one active platform at a time
-                    break
+                # Update tracking status
+                self.ui.update_tracking_status(tracking_data)
+
+            # Update UI with gesture events
+            if self._gesture_events:
+                # popleft per item so events appended meanwhile are not lost
+                gesture_events = [self._gesture_events.popleft() for _ in range(len(self._gesture_events))]
+                self.ui.add_gesture_events(gesture_events)
 
         except Exception as e:
-            logging.error(f"Error processing streaming platforms: {e}")
+            logging.error(f"Error updating UI: {e}")
+
+        self.ui.root.after(16, self._drain_ui_events)
+
+    def _refresh_active_plugin(self):
+        """Re-detect the active streaming platform - reschedules itself every 500ms"""
+        try:
+            # Rescan only when the focused window changed, or every 5s as a fallback
+            # where the focused window cannot be queried
+            foreground_window = self._get_foreground_window() if self._get_foreground_window else None
+            now = time.monotonic()
+            changed = foreground_window is not None and foreground_window != self._last_foreground_window
+            if changed or now - self._last_plugin_scan >= 5.0:
+                self._last_foreground_window = foreground_window
+                self._last_plugin_scan = now
+                self._scan_streaming_plugins()
+
+        except Exception as e:
+            logging.error(f"Error detecting streaming platforms: {e}")
+
+        if self.is_running:
+            self._plugin_timer = threading.Timer(0.5, self._refresh_active_plugin)
+            self._plugin_timer.daemon = True
+            self._plugin_timer.start()
 
-        return actions
+    def _scan_streaming_plugins(self):
+        """Find the active streaming plugin and update plugin activation"""
+        active_idx = -1
+
+        # Only one active platform is processed at a time
+        for i, plugin in enumerate(self.streaming_plugins):
+            if plugin.is_platform_active():
+                active_idx = i
+                break
+
+        for i, plugin in enumerate(self.streaming_plugins):
+            if i == active_idx and not plugin.is_active:
+                plugin.activate()
+            elif i != active_idx and plugin.is_active:
+                plugin.deactivate()
+
+        self._active_plugin_idx = active_idx
+
+    def process_streaming_platforms(self, eye_position, tracking_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Process streaming platform specific gestures"""
+        active_idx = self._active_plugin_idx
+        if not eye_position or active_idx < 0:
+            return []
+
+        try:
+            plugin = self.streaming_plugins[active_idx]
+            return plugin.process_streaming_gestures(eye_position, tracking_data)
+        except Exception as e:
+            logging.error(f"Error processing streaming platforms: {e}")
+            return []
 
     def start_calibration(self):
-        """Start the calibration process"""
-        if self.calibration_thread and self.calibration_thread.is_alive():
+        """Start the calibration process - steps run on the Tk main loop"""
+        if self._calibration_points is not None:
             return
 
-        self.calibration_thread = threading.Thread(target=self.calibration_loop, daemon=True)
-        self.calibration_thread.start()
-
-    def calibration_loop(self):
-        """Calibration process loop"""
         try:
             # Get calibration points
-            calibration_points = self.eye_tracker.start_calibration(num_points=9)
+            self._calibration_points = self.eye_tracker.start_calibration(num_points=9)
+            self._calibration_samples = np.empty((30, 2), dtype=np.float32)
+            self._calibration_interval_ms = max(1, int(1000 / self.config.get_setting("tracking", "frame_rate", 30)))
 
-            for i, point in enumerate(calibration_points):
-                if not self.ui.is_calibrating:
-                    break
+            self.ui.root.after(0, self._calibration_step, 0, 0, 0)
 
-                # Update progress
-                progress = (i / len(calibration_points)) * 100
-                self.ui.cal_progress['value'] = progress
+        except Exception as e:
+            self._calibration_error(e)
 
-                # Show calibration point (this would need a full-screen calibration window)
-                # For now, we'll simulate the calibration process
-                logging.info(f"Calibrating point {i+1}/{len(calibration_points)}: {point}")
+    def _calibration_step(self, point_idx: int, frame_idx: int, num_samples: int):
+        """Read one calibration frame, then reschedule itself at the camera frame rate"""
+        try:
+            calibration_points = self._calibration_points
 
-                # Collect eye data for this point (simulated)
-                eye_data = []
-                for _ in range(30):  # Collect 30 samples
-                    if not self.ui.is_calibrating:
-                        break
+            if not self.ui.is_calibrating:
+                self._calibration_points = None
+                return
 
-                    _, tracking_data = self.eye_tracker.process_frame()
-                    if tracking_data.get("eye_position"):
-                        eye_data.append(tracking_data["eye_position"])
+            if point_idx == len(calibration_points):
+                self._finish_calibration()
+                return
 
-                    time.sleep(0.1)  # 100ms between samples
+            point = calibration_points[point_idx]
+            if frame_idx == 0:
+                # Update progress
+                progress = (point_idx / len(calibration_points)) * 100
+                self.ui.cal_progress['value'] = progress
 
+                # Show calibration point (this would need a full-screen calibration window)
+                # For now, we'll simulate the calibration process
+                logging.info(f"Calibrating point {point_idx+1}/{len(calibration_points)}: {point}")
+
+            # Collect eye data for this point (simulated). The first read drops
+            # frames queued before this point was shown.
+            _, tracking_data = self.eye_tracker.process_frame(latest_only=frame_idx == 0)
+            if tracking_data.get("eye_position"):
+                self._calibration_samples[num_samples] = tracking_data["eye_position"]
+                num_samples += 1
+            frame_idx += 1
+
+            # Collect 30 samples, giving up after 90 frames
+            if num_samples == len(self._calibration_samples) or frame_idx == 90:
                 # Add calibration point
-                if eye_data:
-                    self.eye_tracker.add_calibration_point(point, eye_data)
-
-            # Finish calibration
-            if self.ui.is_calibrating:
-                success = self.eye_tracker.finish_calibration()
-                if success:
-                    self.ui.cal_status_label.config(text="Calibrated successfully")
-                    self.ui.cal_progress['value'] = 100
-                    logging.info("Calibration completed successfully")
-                else:
-                    self.ui.cal_status_label.config(text="Calibration failed")
-                    logging.error("Calibration failed")
+                if num_samples:
+                    self.eye_tracker.add_calibration_point(point, self._calibration_samples[:num_samples])
+                point_idx, frame_idx, num_samples = point_idx + 1, 0, 0
 
-            self.ui.is_calibrating = False
+            self.ui.root.after(self._calibration_interval_ms, self._calibration_step,
+                               point_idx, frame_idx, num_samples)
 
         except Exception as e:
-            logging.error(f"Error during calibration: {e}")
-            self.ui.cal_status_label.config(text="Calibration error")
-            self.ui.is_calibrating = False
+            self._calibration_error(e)
+
+    def _finish_calibration(self):
+        """Compute the calibration once all points have been sampled"""
+        success = self.eye_tracker.finish_calibration()
+        if success:
+            self.ui.cal_status_label.config(text="Calibrated successfully")
+            self.ui.cal_progress['value'] = 100
+            logging.info("Calibration completed successfully")
+        else:
+            self.ui.cal_status_label.config(text="Calibration failed")
+            logging.error("Calibration failed")
+
+        self.ui.is_calibrating = False
+        self._calibration_points = None
+
+    def _calibration_error(self, error: Exception):
+        """Abort calibration after an error"""
+        logging.error(f"Error during calibration: {error}")
+        self.ui.cal_status_label.config(text="Calibration error")
+        self.ui.is_calibrating = False
+        self._calibration_points = None
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get current performance statistics"""
-        current_time = time.time()
+        current_time = time.perf_counter()
         elapsed_time = current_time - self.start_time
 
         stats = {
@@ -302,7 +576,7 @@ class EyeControlledInterface:
             "frames_processed": self.frame_count,
             "average_fps": self.frame_count / elapsed_time if elapsed_time > 0 else 0,
             "is_running": self.is_running,
-            "active_plugins": [p.platform_name for p in self.streaming_plugins if p.is_platform_active()]
+            "active_plugins": [p.platform_name for p in self.streaming_plugins if p.is_active]
         }
 
         # Add eye tracker stats
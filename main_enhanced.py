@@ -5,9 +5,13 @@ Comprehensive system with bug catcher, gesture control, and all working componen
 """
 
 import sys
+import json
+import queue
 import threading
 import time
 import logging
+import logging.handlers
+import atexit
 import traceback
 import subprocess
 import cv2
@@ -18,19 +22,147 @@ from collections import deque
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+try:
+    import pyautogui
+except Exception:  # ImportError, or no display to connect to
+    pyautogui = None
+
+try:
+    import input_backend
+except Exception:  # its PyAutoGUI fallback is unavailable too
+    input_backend = None
+
+try:
+    from PIL import Image, ImageTk
+    PILLOW_AVAILABLE = True
+except ImportError:
+    PILLOW_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
 # Import advanced gesture detection modules
 from advanced_gesture_detector import AdvancedGestureDetector, GestureType
 from gesture_action_processor import GestureActionProcessor
 
-# Configure comprehensive logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('eye_tracking_enhanced.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure comprehensive logging - records are queued and written by a
+# listener thread so the tracking loop never waits on file I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('eye_tracking_enhanced.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+# force=True replaces the default handler installed by any module that logged on import
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)], force=True)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Bit order of the _detect_eye_dir mask
+EYE_DIR_GESTURES = ('eye_left', 'eye_right', 'eye_up', 'eye_down')
+
+@njit(cache=True, fastmath=True)
+def _detect_eye_dir(recent_xy, last_times, cooldowns, now):
+    """Bitmask of eye-direction gestures fired by the recent positions
+
+    Bits follow EYE_DIR_GESTURES. last_times holds each gesture's last
+    fire time and is updated in place for the ones that fire; cooldowns
+    holds each gesture's minimum gap between fires.
+    """
+    fired = 0
+    for axis in range(2):
+        movement = recent_xy[-1, axis] - recent_xy[0, axis]
+        if abs(movement) > 0.1:
+            # left/up on the negative side, right/down on the positive
+            bit = 2 * axis + (1 if movement > 0 else 0)
+            if now - last_times[bit] > cooldowns[bit]:
+                fired |= 1 << bit
+                last_times[bit] = now
+    return np.uint8(fired)
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) at import rather than on the first frame
+    _detect_eye_dir(np.zeros((5, 2), dtype=np.float32), np.zeros(4, dtype=np.float64),
+                    np.zeros(4, dtype=np.float64), 0.0)
+
+def _landmarks_to_ndarray(landmarks) -> np.ndarray:
+    """Copy MediaPipe landmarks into an (N, 3) float32 array of normalized x, y, z"""
+    return np.fromiter((c for lm in landmarks for c in (lm.x, lm.y, lm.z)),
+                       dtype=np.float32, count=3 * len(landmarks)).reshape(-1, 3)
+
+class CameraThread:
+    """Grabs camera frames continuously and decodes only the one the caller reads"""
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.lock = threading.Lock()  # Guards only the _latest hand-off, never the camera
+        self.running = False
+        self.thread = None
+        self.grab_count = 0
+        self._latest = None
+        self._want = threading.Event()        # Set by read_latest() to ask for a decode
+        self.frame_ready = threading.Event()  # Set once the requested frame is decoded
+
+    def start(self):
+        """Start the grab thread"""
+        self.running = True
+        self.thread = threading.Thread(target=self._grab_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop the grab thread"""
+        self.running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=1.0)
+
+    def _grab_loop(self):
+        """Keep the driver queue empty - grab() dequeues a frame without decoding it
+
+        Only this thread touches the camera. A requested frame is retrieved between
+        grabs, so no lock is held while grab() waits on the sensor.
+        """
+        while self.running:
+            ok = self.cap.grab()
+            if not ok:
+                time.sleep(0.01)
+                continue
+
+            self.grab_count += 1
+            if self._want.is_set():
+                ret, frame = self.cap.retrieve()
+                if ret:
+                    with self.lock:
+                        self._latest = frame
+                    self._want.clear()
+                    self.frame_ready.set()
+
+    def read_latest(self, timeout=0.1):
+        """Request the next grabbed frame and wait for it to be decoded, or return None on timeout
+
+        The wait is for the next sensor frame only; the lock taken here is never held
+        across grab(), so a pending grab cannot add a further frame of delay.
+        """
+        self.frame_ready.clear()
+        self._want.set()
+        if not self.frame_ready.wait(timeout):
+            return None
+
+        with self.lock:
+            frame, self._latest = self._latest, None
+        return frame
 
 class EnhancedEyeControlledInterface:
     def __init__(self):
@@ -51,7 +183,7 @@ class EnhancedEyeControlledInterface:
         self.is_running = False
         self.tracking_thread = None
         self.frame_count = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
         print("✅ Enhanced Eye-Controlled Interface initialized!")
         self.print_controls()
@@ -72,10 +204,66 @@ class EnhancedEyeControlledInterface:
                                   capture_output=True, text=True, check=True)
             self.screen_w, self.screen_h = map(int, result.stdout.strip().split())
         else:
-            import pyautogui
+            if pyautogui is None:
+                raise RuntimeError("Neither xdotool nor PyAutoGUI is available for mouse control")
             self.screen_w, self.screen_h = pyautogui.size()
 
         print(f"Screen resolution: {self.screen_w}x{self.screen_h}")
+        self._screen_wh = np.array([self.screen_w, self.screen_h], dtype=np.float32)
+        self._screen_max = self._screen_wh - 1
+
+        # Bind the backend-specific primitives once so the per-event paths never branch on it.
+        # xdotool drives XTest, so when input_backend has an XTest connection use it directly
+        # instead of forking an xdotool process per event
+        if self.mouse_backend == 'xdotool' and input_backend is not None and input_backend.BACKEND == 'xtest':
+            self._mouse_move = input_backend.move_to
+            self._mouse_click = input_backend.click
+            self._scroll_v = input_backend.scroll
+            self._scroll_h = input_backend.hscroll
+        elif self.mouse_backend == 'xdotool':
+            self._mouse_move = self._move_mouse_xdo
+            self._mouse_click = self._click_mouse_xdo
+            self._scroll_h = self._scroll_horizontal_xdo
+            self._scroll_v = self._scroll_vertical_xdo
+        else:
+            self._mouse_move = self._move_mouse_pag
+            self._mouse_click = self._click_mouse_pag
+            self._scroll_h = self._scroll_horizontal_pag
+            self._scroll_v = self._scroll_vertical_pag
+
+    # xdotool primitives
+    def _move_mouse_xdo(self, x, y):
+        result = subprocess.run(['xdotool', 'mousemove', str(int(x)), str(int(y))],
+                                capture_output=True, check=True, timeout=0.05)
+        if result.stderr:
+            logging.warning(f"xdotool stderr: {result.stderr.decode()}")
+
+    def _click_mouse_xdo(self, button):
+        button_map = {'left': '1', 'right': '3', 'middle': '2'}
+        subprocess.run(['xdotool', 'click', button_map.get(button, '1')],
+                       capture_output=True, check=True, timeout=0.5)
+
+    # Wheel buttons 4-7, one click per scroll step, as the XTest and PyAutoGUI paths send
+    def _scroll_horizontal_xdo(self, amount):
+        subprocess.run(['xdotool', 'click', '--repeat', str(abs(int(amount))), '7' if amount > 0 else '6'],
+                       capture_output=True)
+
+    def _scroll_vertical_xdo(self, amount):
+        subprocess.run(['xdotool', 'click', '--repeat', str(abs(int(amount))), '4' if amount > 0 else '5'],
+                       capture_output=True)
+
+    # PyAutoGUI primitives
+    def _move_mouse_pag(self, x, y):
+        pyautogui.moveTo(x, y)
+
+    def _click_mouse_pag(self, button):
+        pyautogui.click(button=button)
+
+    def _scroll_horizontal_pag(self, amount):
+        pyautogui.hscroll(amount)
+
+    def _scroll_vertical_pag(self, amount):
+        pyautogui.scroll(amount)
 
     def initialize_mediapipe(self):
         """Initialize MediaPipe with optimal settings"""
@@ -96,11 +284,29 @@ class EnhancedEyeControlledInterface:
             print("❌ Cannot open camera")
             sys.exit(1)
 
-        # Configure camera
-        self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        # Capture at FaceMesh-friendly resolution; landmarks are normalized so
+        # nothing downstream depends on it. The preview is scaled up for display
+        self.capture_size = (320, 240)
+        self.preview_size = (640, 480)  # None shows the capture resolution as-is
+
+        # Configure camera - ask for MJPG before the resolution so the driver
+        # picks a compressed mode instead of raw YUYV
+        self.camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.capture_size[0])
+        self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.capture_size[1])
         self.camera.set(cv2.CAP_PROP_FPS, 30)
         self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        fourcc = int(self.camera.get(cv2.CAP_PROP_FOURCC))
+        if fourcc != cv2.VideoWriter_fourcc(*'MJPG'):
+            fourcc_name = fourcc.to_bytes(4, 'little').decode('ascii', 'replace')
+            logging.warning(f"Camera did not accept MJPG, using {fourcc_name}")
+
+        # FaceMesh input buffer, sized from the first frame the camera delivers
+        self._rgb_buf = None
+
+        # Frames are grabbed in the background and decoded on demand
+        self.camera_thread = CameraThread(self.camera)
         print("✅ Camera initialized")
 
     def setup_tracking_parameters(self):
@@ -109,9 +315,36 @@ class EnhancedEyeControlledInterface:
         self.dead_zone = 0.01
         self.smoothing_factor = 0.8
 
-        # Buffers for smoothing and gesture detection
-        self.position_buffer = deque(maxlen=8)
-        self.blink_buffer = deque(maxlen=5)
+        # Buffers for smoothing and gesture detection. position_buffer holds the
+        # last pos_len positions, oldest first, in its final rows
+        self.position_buffer = np.zeros((8, 2), dtype=np.float32)
+        self.pos_len = 0
+
+        # Exponential smoothing weights for each possible buffer fill level
+        self._smooth_weights = [None]
+        for n in range(1, len(self.position_buffer) + 1):
+            weights = np.exp(np.linspace(-1, 0, n)).astype(np.float32)
+            self._smooth_weights.append(weights / weights.sum())
+
+        # Right/left iris landmark rows and their blend weights
+        self._iris_rows = np.array([475, 468])
+        self._iris_weights = np.array([0.7, 0.3], dtype=np.float32)
+        self.iris_xy = None
+
+        # FaceMesh runs every _mp_stride frames; frames in between reuse the
+        # last landmarks with the iris rows moved by optical flow
+        self._mp_stride = 2
+        self._last_face = None
+        self._last_pts = None
+        self._prev_gray = None
+
+        # Landmarks, overlay text and the preview window are drawn every _render_stride frames
+        self._render_stride = 3
+
+        self.blink_buffer = np.zeros(5, dtype=np.float64)  # Ring of eye-openness ratios
+        self.blink_idx = 0
+        self.blink_len = 0
+        self.blink_sum = 0.0
         self.gesture_buffer = deque(maxlen=10)
 
         # Performance monitoring
@@ -141,6 +374,10 @@ class EnhancedEyeControlledInterface:
         self.last_gesture_time = {}
         for gesture in self.gesture_patterns:
             self.last_gesture_time[gesture] = 0
+        # Eye-direction last-fire times and cooldowns, indexed like EYE_DIR_GESTURES
+        self._last_gesture_arr = np.zeros(len(EYE_DIR_GESTURES), dtype=np.float64)
+        self._cooldowns = np.array([self.gesture_patterns[g]['cooldown'] for g in EYE_DIR_GESTURES],
+                                   dtype=np.float64)
 
         print("✅ Gesture recognition configured")
 
@@ -158,6 +395,24 @@ class EnhancedEyeControlledInterface:
             'total_advanced_gestures': 0
         }
 
+        # Stat counter and feedback text per gesture type; None means the
+        # text depends on runtime state and is built in process_advanced_gestures
+        self._gest_lookup = {
+            GestureType.LEFT_WINK: ('left_winks', "👈 Left Wink → Left Click"),
+            GestureType.RIGHT_WINK: ('right_winks', "👉 Right Wink → Right Click"),
+            GestureType.BOTH_BLINK: ('both_blinks', None),
+            GestureType.HEAD_TILT_DOWN: ('head_tilts', None),
+            GestureType.HEAD_TILT_UP: ('head_tilts', None),
+            GestureType.HEAD_TILT_LEFT: ('head_tilts', None),
+            GestureType.HEAD_TILT_RIGHT: ('head_tilts', None),
+        }
+        self._tilt_direction = {
+            GestureType.HEAD_TILT_DOWN: 'Down',
+            GestureType.HEAD_TILT_UP: 'Up',
+            GestureType.HEAD_TILT_LEFT: 'Left',
+            GestureType.HEAD_TILT_RIGHT: 'Right',
+        }
+
         # Visual feedback for gestures
         self.last_gesture_feedback = ""
         self.gesture_feedback_time = 0
@@ -166,25 +421,104 @@ class EnhancedEyeControlledInterface:
 
     def setup_bug_catcher(self):
         """Setup comprehensive bug catching and debugging"""
+        # Rare events stay as dicts, in bounded deques so a long session or an
+        # error storm cannot grow them without limit
         self.debug_data = {
-            'face_detected': [],
-            'eye_positions': [],
-            'mouse_movements': [],
-            'gestures_detected': [],
-            'errors': [],
-            'performance_metrics': []
+            'gestures_detected': deque(maxlen=10000),
+            'errors': deque(maxlen=10000)
         }
+        self._debug_rollover_warned = set()
+
+        # Per-frame streams go into preallocated structured rings; a full ring is
+        # flushed to its own numbered archive and reused, and the partial rings are
+        # flushed at shutdown, so the archives of one session cover all of it
+        ring_size = 10000
+        self._debug_rings = {
+            'face_detected': np.zeros(ring_size, dtype=[('ts', 'f8'), ('frame', 'i4'), ('detected', '?')]),
+            'eye_positions': np.zeros(ring_size, dtype=[('ex', 'f4'), ('ey', 'f4'), ('sx', 'i2'), ('sy', 'i2'),
+                                                        ('ts', 'f8'), ('moved', '?')]),
+            'performance_metrics': np.zeros(ring_size, dtype=[('ts', 'f8'), ('frame_ms', 'f4')]),
+        }
+        self._debug_idx = dict.fromkeys(self._debug_rings, 0)
+        self._debug_parts = dict.fromkeys(self._debug_rings, 0)
+        self._debug_session = int(time.time())
+        # The rings and deques are written by the tracking thread, so saves run there;
+        # the UI only asks for one while tracking is active
+        self._debug_save_requested = False
+        self._last_tb_time = 0.0
+
+        # Session-wide counters so save-time stats do not depend on ring contents
+        self._face_detected_count = 0
+        self._face_total = 0
+        self._errors_count = 0
 
         self.debug_mode = True
+        self.verbose = False  # Console output for clicks and periodic debug saves
         self.save_debug_interval = 100  # Save debug data every 100 frames
 
         print("✅ Bug catcher initialized")
 
+    def _record_error(self, error_type, error):
+        """Add an error to the debug log
+
+        A repeat of the previous error only bumps its count, and tracebacks
+        are formatted at most once per second.
+        """
+        if not self.debug_mode:
+            return
+
+        self._errors_count += 1
+        message = str(error)
+        errors = self.debug_data['errors']
+        last = errors[-1] if errors else None
+        if last and last['type'] == error_type and last['error'] == message:
+            last['repeat'] = last.get('repeat', 1) + 1
+            return
+
+        entry = {'type': error_type, 'error': message, 'timestamp': time.time()}
+        now = time.monotonic()
+        if now - self._last_tb_time > 1.0:
+            entry['traceback'] = traceback.format_exc()
+            self._last_tb_time = now
+        self._append_debug('errors', entry)
+
+    def _append_debug(self, name, entry):
+        """Append to a bounded debug deque, warning once when it starts dropping entries"""
+        events = self.debug_data[name]
+        if len(events) == events.maxlen and name not in self._debug_rollover_warned:
+            self._debug_rollover_warned.add(name)
+            logging.warning(f"Debug log '{name}' reached {events.maxlen} entries; dropping the oldest")
+        events.append(entry)
+
+    def _debug_slot(self, name):
+        """Next write index in a debug ring, flushing the ring first if it is full"""
+        i = self._debug_idx[name]
+        if i == len(self._debug_rings[name]):
+            self._flush_debug_ring(name)
+            i = 0
+        self._debug_idx[name] = i + 1
+        return i
+
+    def _flush_debug_ring(self, name):
+        """Write the filled part of a debug ring to the session's next archive and reset its index"""
+        part = self._debug_parts[name]
+        np.savez_compressed(f"eye_tracking_debug_{self._debug_session}_{name}_{part:03d}.npz",
+                            **{name: self._debug_rings[name][:self._debug_idx[name]]})
+        self._debug_parts[name] = part + 1
+        self._debug_idx[name] = 0
+
+    def request_debug_save(self):
+        """Save debug data now, or on the tracking thread's next frame while it is running"""
+        if self.is_running:
+            self._debug_save_requested = True
+        else:
+            self.save_debug_data()
+
     def setup_ui(self):
         """Setup enhanced UI with comprehensive controls"""
         self.root = tk.Tk()
         self.root.title("Enhanced Eye-Controlled Interface")
-        self.root.geometry("800x600")
+        self.root.geometry("1100x600")
 
         # Create main frame
         main_frame = ttk.Frame(self.root, padding="10")
@@ -200,7 +534,7 @@ class EnhancedEyeControlledInterface:
         self.stop_button = ttk.Button(control_frame, text="Stop Tracking", command=self.stop_tracking)
         self.stop_button.grid(row=0, column=1, padx=5)
 
-        self.debug_button = ttk.Button(control_frame, text="Save Debug Data", command=self.save_debug_data)
+        self.debug_button = ttk.Button(control_frame, text="Save Debug Data", command=self.request_debug_save)
         self.debug_button.grid(row=0, column=2, padx=5)
 
         # Status display
@@ -239,184 +573,157 @@ class EnhancedEyeControlledInterface:
                                     orient=tk.HORIZONTAL, command=self.update_sensitivity)
         sensitivity_scale.grid(row=0, column=1, sticky=(tk.W, tk.E))
 
+        # Camera preview - frames come from the tracking thread through
+        # _preview_q and are painted here on the Tk thread
+        preview_frame = ttk.LabelFrame(main_frame, text="Preview", padding="10")
+        preview_frame.grid(row=0, column=2, rowspan=4, sticky=(tk.N, tk.W), padx=5, pady=5)
+        self.video_label = ttk.Label(preview_frame)
+        self.video_label.grid(row=0, column=0)
+        self.video_photo = None
+        self._preview_q = queue.Queue(maxsize=1)
+
+        # Keys that used to go through the OpenCV window
+        self.root.bind('<KeyPress-q>', lambda event: self.stop_tracking())
+        self.root.bind('<KeyPress-plus>', lambda event: self._nudge_sensitivity(0.1))
+        self.root.bind('<KeyPress-minus>', lambda event: self._nudge_sensitivity(-0.1))
+
+        if PILLOW_AVAILABLE:
+            self.root.after(33, self._drain_preview)
+        else:
+            logging.warning("PIL/ImageTk not available, video preview disabled")
+
         print("✅ UI initialized")
 
+    def _drain_preview(self):
+        """Paint the newest preview frame, if any, and reschedule"""
+        try:
+            frame = self._preview_q.get_nowait()
+        except queue.Empty:
+            frame = None
+
+        if frame is not None:
+            size = frame.shape[1::-1]
+            if self.video_photo is None or (self.video_photo.width(), self.video_photo.height()) != size:
+                self.video_photo = ImageTk.PhotoImage("RGB", size)
+                self.video_label.configure(image=self.video_photo)
+            # Swap BGR -> RGB in the decoder rather than with an extra cvtColor
+            self.video_photo.paste(Image.frombuffer("RGB", size, frame, "raw", "BGR", 0, 1))
+
+        self.root.after(33, self._drain_preview)
+
+    def _nudge_sensitivity(self, delta):
+        """Step sensitivity from the keyboard, within the slider's range"""
+        self.sensitivity = min(3.0, max(0.1, self.sensitivity + delta))
+        self.sensitivity_var.set(self.sensitivity)
+
     def move_mouse(self, x, y):
         """Move mouse using the best available backend"""
         try:
             self.mouse_move_count += 1
 
-            if self.mouse_backend == 'xdotool':
-                result = subprocess.run(['xdotool', 'mousemove', str(int(x)), str(int(y))],
-                             capture_output=True, check=True, timeout=0.05)
-                # Debug: Print any xdotool errors
-                if result.stderr:
-                    print(f"⚠️  xdotool stderr: {result.stderr.decode()}")
-            else:
-                import pyautogui
-                pyautogui.moveTo(x, y)
+            self._mouse_move(x, y)
 
             self.mouse_move_success += 1
 
-            # Debug: Print successful moves occasionally
-            if self.mouse_move_count % 60 == 0:
-                print(f"🖱️  Mouse moved to ({int(x)}, {int(y)}) - Success rate: {self.mouse_move_success/self.mouse_move_count*100:.1f}%")
-
             return True
         except Exception as e:
-            print(f"❌ Mouse movement failed: {e}")
-            if self.debug_mode:
-                self.debug_data['errors'].append({
-                    'type': 'mouse_movement',
-                    'error': str(e),
-                    'timestamp': time.time()
-                })
+            logging.error(f"Mouse movement failed: {e}")
+            self._record_error('mouse_movement', e)
             return False
 
     def click_mouse(self, button='left'):
         """Click mouse using the best available backend"""
         try:
-            if self.mouse_backend == 'xdotool':
-                button_map = {'left': '1', 'right': '3', 'middle': '2'}
-                subprocess.run(['xdotool', 'click', button_map.get(button, '1')],
-                             capture_output=True, check=True, timeout=0.5)
-            else:
-                import pyautogui
-                if button == 'left':
-                    pyautogui.click()
-                elif button == 'right':
-                    pyautogui.rightClick()
-                elif button == 'middle':
-                    pyautogui.middleClick()
+            self._mouse_click(button)
 
             return True
         except Exception as e:
-            if self.debug_mode:
-                self.debug_data['errors'].append({
-                    'type': 'mouse_click',
-                    'error': str(e),
-                    'timestamp': time.time()
-                })
+            self._record_error('mouse_click', e)
             return False
 
-    def get_iris_position(self, landmarks):
-        """Get iris position with multiple fallback methods"""
-        try:
-            if len(landmarks) > 475:
-                right_iris = landmarks[475]
-                if len(landmarks) > 468:
-                    left_iris = landmarks[468]
-                    # Weighted average
-                    avg_x = right_iris.x * 0.7 + left_iris.x * 0.3
-                    avg_y = right_iris.y * 0.7 + left_iris.y * 0.3
-                    return (avg_x, avg_y)
-                else:
-                    return (right_iris.x, right_iris.y)
-        except Exception as e:
-            if self.debug_mode:
-                self.debug_data['errors'].append({
-                    'type': 'iris_detection',
-                    'error': str(e),
-                    'timestamp': time.time()
-                })
-        return None
-
-    def apply_smoothing(self, position):
-        """Apply smoothing to reduce jitter"""
-        self.position_buffer.append(position)
-
-        if len(self.position_buffer) < 2:
-            return position
-
-        # Exponential weighted average
-        weights = np.exp(np.linspace(-1, 0, len(self.position_buffer)))
-        weights /= weights.sum()
+    def _iris_to_screen(self, pts):
+        """Map the frame's (N, 3) landmark array straight to smoothed screen coordinates
 
-        smooth_x = sum(w * pos[0] for w, pos in zip(weights, self.position_buffer))
-        smooth_y = sum(w * pos[1] for w, pos in zip(weights, self.position_buffer))
-
-        return (smooth_x, smooth_y)
-
-    def map_to_screen(self, eye_pos):
-        """Map eye position to screen coordinates"""
-        eye_x, eye_y = eye_pos
-
-        # Apply dead zone
-        center_x, center_y = 0.5, 0.5
-        offset_x = eye_x - center_x
-        offset_y = eye_y - center_y
+        Iris extraction, smoothing and screen mapping in one pass over float32
+        arrays. The raw iris position is left in self.iris_xy for logging.
+        """
+        try:
+            if len(pts) <= 475:
+                return None
 
-        if abs(offset_x) < self.dead_zone:
-            offset_x = 0
-        if abs(offset_y) < self.dead_zone:
-            offset_y = 0
+            # Weighted average of right (475) and left (468) iris
+            self.iris_xy = self._iris_weights @ pts[self._iris_rows, :2]
 
-        # Direct mapping with sensitivity
-        screen_x = eye_x * self.screen_w * self.sensitivity
-        screen_y = eye_y * self.screen_h * self.sensitivity
+            # Shift the window and append the newest position at the end
+            self.position_buffer[:-1] = self.position_buffer[1:]
+            self.position_buffer[-1] = self.iris_xy
+            self.pos_len = min(self.pos_len + 1, len(self.position_buffer))
 
-        # Clamp to bounds
-        screen_x = max(0, min(self.screen_w - 1, screen_x))
-        screen_y = max(0, min(self.screen_h - 1, screen_y))
+            # Exponential weighted average
+            smooth = self._smooth_weights[self.pos_len] @ self.position_buffer[-self.pos_len:]
 
-        return (int(screen_x), int(screen_y))
+            # Direct mapping with sensitivity, clamped to the screen
+            screen_x, screen_y = np.clip(smooth * self._screen_wh * self.sensitivity, 0, self._screen_max)
+            return (int(screen_x), int(screen_y))
+        except Exception as e:
+            self._record_error('iris_detection', e)
+        return None
 
-    def detect_blink(self, landmarks):
+    def _track_iris(self, frame):
+        """Carry the last landmarks forward, moving the iris rows by optical flow"""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        pts = self._last_pts
+        if self._prev_gray is not None and len(pts) > 475:
+            h, w = gray.shape
+            scale = np.array([w, h], dtype=np.float32)
+            p0 = (pts[self._iris_rows, :2] * scale).reshape(-1, 1, 2)
+            p1, status, _ = cv2.calcOpticalFlowPyrLK(self._prev_gray, gray, p0, None,
+                                                     winSize=(15, 15), maxLevel=2)
+            ok = status.ravel() == 1
+            pts[self._iris_rows[ok], :2] = p1.reshape(-1, 2)[ok] / scale
+        self._prev_gray = gray
+        return pts
+
+    def detect_blink(self, pts):
         """Detect blinks for clicking"""
         try:
-            left_ratio = abs(landmarks[159].y - landmarks[145].y)
-            right_ratio = abs(landmarks[386].y - landmarks[374].y)
-            avg_ratio = (left_ratio + right_ratio) / 2
+            left_ratio = abs(pts[159, 1] - pts[145, 1])
+            right_ratio = abs(pts[386, 1] - pts[374, 1])
+            avg_ratio = float(left_ratio + right_ratio) / 2
 
-            self.blink_buffer.append(avg_ratio)
+            # Keep a running sum over the ring instead of re-summing it
+            self.blink_sum += avg_ratio - self.blink_buffer[self.blink_idx]
+            self.blink_buffer[self.blink_idx] = avg_ratio
+            self.blink_idx = (self.blink_idx + 1) % len(self.blink_buffer)
+            self.blink_len = min(self.blink_len + 1, len(self.blink_buffer))
 
-            if len(self.blink_buffer) < 3:
+            if self.blink_len < 3:
                 return False
 
-            current_avg = sum(self.blink_buffer) / len(self.blink_buffer)
+            current_avg = self.blink_sum / self.blink_len
             return current_avg < self.blink_threshold
 
         except Exception as e:
-            if self.debug_mode:
-                self.debug_data['errors'].append({
-                    'type': 'blink_detection',
-                    'error': str(e),
-                    'timestamp': time.time()
-                })
+            self._record_error('blink_detection', e)
             return False
 
-    def detect_gestures(self, eye_pos, landmarks):
+    def detect_gestures(self, eye_pos, pts, now):
         """Detect advanced eye gestures"""
-        current_time = time.time()
         gestures_detected = []
 
         # Eye movement gestures
-        if len(self.position_buffer) >= 5:
-            recent_positions = list(self.position_buffer)[-5:]
-
-            # Detect horizontal movement
-            x_movement = recent_positions[-1][0] - recent_positions[0][0]
-            if abs(x_movement) > 0.1:
-                if x_movement > 0 and current_time - self.last_gesture_time['eye_right'] > 0.3:
-                    gestures_detected.append('eye_right')
-                    self.last_gesture_time['eye_right'] = current_time
-                elif x_movement < 0 and current_time - self.last_gesture_time['eye_left'] > 0.3:
-                    gestures_detected.append('eye_left')
-                    self.last_gesture_time['eye_left'] = current_time
-
-            # Detect vertical movement
-            y_movement = recent_positions[-1][1] - recent_positions[0][1]
-            if abs(y_movement) > 0.1:
-                if y_movement > 0 and current_time - self.last_gesture_time['eye_down'] > 0.3:
-                    gestures_detected.append('eye_down')
-                    self.last_gesture_time['eye_down'] = current_time
-                elif y_movement < 0 and current_time - self.last_gesture_time['eye_up'] > 0.3:
-                    gestures_detected.append('eye_up')
-                    self.last_gesture_time['eye_up'] = current_time
+        if self.pos_len >= 5:
+            fired = _detect_eye_dir(self.position_buffer[-5:], self._last_gesture_arr,
+                                    self._cooldowns, now)
+            if fired:
+                for bit, gesture in enumerate(EYE_DIR_GESTURES):
+                    if fired & (1 << bit):
+                        gestures_detected.append(gesture)
+                        self.last_gesture_time[gesture] = self._last_gesture_arr[bit]
 
         return gestures_detected
 
-    def process_gestures(self, gestures):
+    def process_gestures(self, gestures, now):
         """Process detected gestures and perform actions"""
         for gesture in gestures:
             if gesture in self.gesture_patterns:
@@ -434,7 +741,7 @@ class EnhancedEyeControlledInterface:
                 self.gesture_count += 1
 
                 if self.debug_mode:
-                    self.debug_data['gestures_detected'].append({
+                    self._append_debug('gestures_detected', {
                         'gesture': gesture,
                         'action': action,
                         'timestamp': time.time()
@@ -443,34 +750,19 @@ class EnhancedEyeControlledInterface:
     def scroll_horizontal(self, amount):
         """Perform horizontal scrolling"""
         try:
-            if self.mouse_backend == 'xdotool':
-                if amount > 0:
-                    subprocess.run(['xdotool', 'key', 'Right'], capture_output=True)
-                else:
-                    subprocess.run(['xdotool', 'key', 'Left'], capture_output=True)
-            else:
-                import pyautogui
-                pyautogui.hscroll(amount)
+            self._scroll_h(amount)
         except Exception as e:
             logging.error(f"Horizontal scroll error: {e}")
 
     def scroll_vertical(self, amount):
         """Perform vertical scrolling"""
         try:
-            if self.mouse_backend == 'xdotool':
-                if amount > 0:
-                    subprocess.run(['xdotool', 'key', 'Up'], capture_output=True)
-                else:
-                    subprocess.run(['xdotool', 'key', 'Down'], capture_output=True)
-            else:
-                import pyautogui
-                pyautogui.scroll(amount)
+            self._scroll_v(amount)
         except Exception as e:
             logging.error(f"Vertical scroll error: {e}")
 
-    def process_advanced_gestures(self, advanced_gestures, eye_states, head_pose):
+    def process_advanced_gestures(self, advanced_gestures, eye_states, head_pose, now):
         """Process advanced eye and head gestures"""
-        current_time = time.time()
 
         for gesture_data in advanced_gestures:
             gesture_type = gesture_data['type']
@@ -482,36 +774,30 @@ class EnhancedEyeControlledInterface:
                 # Update statistics
                 self.advanced_gesture_stats['total_advanced_gestures'] += 1
 
-                if gesture_type == GestureType.LEFT_WINK:
-                    self.advanced_gesture_stats['left_winks'] += 1
-                    self.last_gesture_feedback = "👈 Left Wink → Left Click"
-                elif gesture_type == GestureType.RIGHT_WINK:
-                    self.advanced_gesture_stats['right_winks'] += 1
-                    self.last_gesture_feedback = "👉 Right Wink → Right Click"
-                elif gesture_type == GestureType.BOTH_BLINK:
-                    self.advanced_gesture_stats['both_blinks'] += 1
+                stat_key, feedback = self._gest_lookup[gesture_type]
+                self.advanced_gesture_stats[stat_key] += 1
+
+                if gesture_type is GestureType.BOTH_BLINK:
                     if self.gesture_action_processor.is_drag_active():
-                        self.last_gesture_feedback = "🖱️  Both Blink → Drag Active"
+                        feedback = "🖱️  Both Blink → Drag Active"
                     else:
-                        self.last_gesture_feedback = "🖱️  Both Blink → Drag End"
-                elif gesture_type in [GestureType.HEAD_TILT_DOWN, GestureType.HEAD_TILT_UP,
-                                    GestureType.HEAD_TILT_LEFT, GestureType.HEAD_TILT_RIGHT]:
-                    self.advanced_gesture_stats['head_tilts'] += 1
+                        feedback = "🖱️  Both Blink → Drag End"
+                elif gesture_type in self._tilt_direction:
                     angle = gesture_data.get('angle', 0.0)
-                    direction = gesture_type.value.replace('head_tilt_', '').replace('_', ' ').title()
-                    self.last_gesture_feedback = f"🎯 Head {direction} ({angle:.1f}°) → Scroll"
+                    feedback = f"🎯 Head {self._tilt_direction[gesture_type]} ({angle:.1f}°) → Scroll"
+                self.last_gesture_feedback = feedback
 
-                self.gesture_feedback_time = current_time
+                self.gesture_feedback_time = now
 
                 # Add to debug data
                 if self.debug_mode:
-                    self.debug_data['gestures_detected'].append({
+                    self._append_debug('gestures_detected', {
                         'gesture': gesture_type.value,
                         'confidence': gesture_data.get('confidence', 0.0),
                         'angle': gesture_data.get('angle', 0.0),
                         'eye_states': eye_states,
                         'head_pose': head_pose,
-                        'timestamp': current_time
+                        'timestamp': time.time()
                     })
 
     def start_tracking(self):
@@ -520,6 +806,7 @@ class EnhancedEyeControlledInterface:
             return
 
         self.is_running = True
+        self.camera_thread.start()
         self.tracking_thread = threading.Thread(target=self.tracking_loop, daemon=True)
         self.tracking_thread.start()
 
@@ -536,6 +823,8 @@ class EnhancedEyeControlledInterface:
         if self.tracking_thread and self.tracking_thread.is_alive():
             self.tracking_thread.join(timeout=2.0)
 
+        self.camera_thread.stop()
+
         self.status_label.config(text="Tracking stopped")
         self.start_button.config(state='normal')
         self.stop_button.config(state='disabled')
@@ -546,159 +835,149 @@ class EnhancedEyeControlledInterface:
         """Main tracking loop with comprehensive functionality"""
         try:
             while self.is_running:
-                frame_start = time.time()
-
-                ret, frame = self.camera.read()
-                if not ret:
+                # Block until the grab thread decodes the next frame - the camera paces the loop
+                frame = self.camera_thread.read_latest(timeout=0.1)
+                if frame is None:
                     continue
 
+                # One clock read per frame, threaded through the helpers; wall
+                # time is only needed for the debug log timestamps
+                now = time.monotonic()
+                wall_now = time.time()
+
                 # Process frame
                 frame = cv2.flip(frame, 1)
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = self.face_mesh.process(rgb_frame)
+                render = PILLOW_AVAILABLE and self.frame_count % self._render_stride == 0
+                run_mesh = self.frame_count % self._mp_stride == 0
+                if run_mesh:
+                    if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                        self._rgb_buf = np.empty_like(frame)
+                    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+
+                    # Read-only lets MediaPipe wrap the buffer without copying it
+                    self._rgb_buf.flags.writeable = False
+                    results = self.face_mesh.process(self._rgb_buf)
+                    self._rgb_buf.flags.writeable = True
+                    face = results.multi_face_landmarks[0] if results.multi_face_landmarks else None
+                    self._last_face = face
+                    self._last_pts = _landmarks_to_ndarray(face.landmark) if face else None
+                    pts = self._last_pts
+                    if self._mp_stride > 1:
+                        self._prev_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                else:
+                    face = self._last_face
+                    pts = self._track_iris(frame) if face else None
 
-                if results.multi_face_landmarks:
-                    landmarks = results.multi_face_landmarks[0].landmark
+                if face:
+                    landmarks = face.landmark
 
                     # Log face detection
                     if self.debug_mode:
-                        self.debug_data['face_detected'].append({
-                            'detected': True,
-                            'timestamp': time.time(),
-                            'frame': self.frame_count
-                        })
-
-                    # Get iris position
-                    iris_pos = self.get_iris_position(landmarks)
-                    if iris_pos:
-                        # Apply smoothing and mapping
-                        smooth_pos = self.apply_smoothing(iris_pos)
-                        screen_x, screen_y = self.map_to_screen(smooth_pos)
+                        self._debug_rings['face_detected'][self._debug_slot('face_detected')] = (
+                            wall_now, self.frame_count, True)
+                        self._face_detected_count += 1
+                        self._face_total += 1
+
+                    # Get smoothed screen position from the iris
+                    screen_pos = self._iris_to_screen(pts)
+                    if screen_pos:
+                        screen_x, screen_y = screen_pos
 
                         # Move cursor
                         success = self.move_mouse(screen_x, screen_y)
 
                         # Log eye position and mouse movement
                         if self.debug_mode:
-                            self.debug_data['eye_positions'].append({
-                                'eye_pos': iris_pos,
-                                'screen_pos': (screen_x, screen_y),
-                                'timestamp': time.time()
-                            })
-
-                            if success:
-                                self.debug_data['mouse_movements'].append({
-                                    'position': (screen_x, screen_y),
-                                    'timestamp': time.time()
-                                })
+                            self._debug_rings['eye_positions'][self._debug_slot('eye_positions')] = (
+                                self.iris_xy[0], self.iris_xy[1], screen_x, screen_y, wall_now, success)
 
                         # Detect and process basic gestures
-                        gestures = self.detect_gestures(iris_pos, landmarks)
+                        gestures = self.detect_gestures(self.iris_xy, pts, now)
                         if gestures:
-                            self.process_gestures(gestures)
+                            self.process_gestures(gestures, now)
 
                         # Detect and process advanced gestures (SELECTIVE - only winks enabled)
-                        advanced_gestures, eye_states, head_pose = self.advanced_gesture_detector.detect_gestures(
-                            landmarks, frame.shape
-                        )
-
-                        if advanced_gestures:
-                            # Filter to only allow wink gestures, block head tilts
-                            filtered_gestures = [g for g in advanced_gestures if 'wink' in g['type'].value]
-                            if filtered_gestures:
-                                self.process_advanced_gestures(filtered_gestures, eye_states, head_pose)
-
-                        # Debug output every 30 frames
-                        if self.frame_count % 30 == 0:
-                            print(f"👁️  Eye: ({iris_pos[0]:.3f}, {iris_pos[1]:.3f}) -> 🖱️  Screen: ({screen_x}, {screen_y})")
+                        # Eyelid landmarks are only fresh on FaceMesh frames
+                        if run_mesh:
+                            advanced_gestures, eye_states, head_pose = self.advanced_gesture_detector.detect_gestures(
+                                landmarks, frame.shape
+                            )
+
+                            if advanced_gestures:
+                                # Filter to only allow wink gestures, block head tilts
+                                filtered_gestures = [g for g in advanced_gestures if 'wink' in g['type'].value]
+                                if filtered_gestures:
+                                    self.process_advanced_gestures(filtered_gestures, eye_states, head_pose, now)
 
                     # Detect blinks for clicking
-                    current_time = time.time()
-                    if (self.detect_blink(landmarks) and
-                        current_time - self.last_click_time > self.click_cooldown):
+                    if (run_mesh and self.detect_blink(pts) and
+                        now - self.last_click_time > self.click_cooldown):
 
                         if self.click_mouse('left'):
-                            self.last_click_time = current_time
-                            print("👆 Click detected!")
+                            self.last_click_time = now
+                            self.last_gesture_feedback = "👆 Blink → Left Click"
+                            self.gesture_feedback_time = now
+                            if __debug__ and self.verbose:
+                                print("👆 Click detected!")
 
                     # Draw landmarks
-                    self.mp_drawing.draw_landmarks(
-                        frame, results.multi_face_landmarks[0],
-                        self.mp_face_mesh.FACEMESH_IRISES,
-                        landmark_drawing_spec=None,
-                        connection_drawing_spec=self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=1)
-                    )
+                    if render:
+                        self.mp_drawing.draw_landmarks(
+                            frame, face,
+                            self.mp_face_mesh.FACEMESH_IRISES,
+                            landmark_drawing_spec=None,
+                            connection_drawing_spec=self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=1)
+                        )
 
                 else:
                     # No face detected
                     if self.debug_mode:
-                        self.debug_data['face_detected'].append({
-                            'detected': False,
-                            'timestamp': time.time(),
-                            'frame': self.frame_count
-                        })
+                        self._debug_rings['face_detected'][self._debug_slot('face_detected')] = (
+                            wall_now, self.frame_count, False)
+                        self._face_total += 1
 
                 # Update performance metrics
-                frame_time = time.time() - frame_start
+                frame_time = time.monotonic() - now
                 if self.debug_mode:
-                    self.debug_data['performance_metrics'].append({
-                        'frame_time': frame_time * 1000,  # ms
-                        'timestamp': time.time()
-                    })
+                    self._debug_rings['performance_metrics'][self._debug_slot('performance_metrics')] = (
+                        wall_now, frame_time * 1000)  # ms
 
                 # Update UI every 10 frames
                 if self.frame_count % 10 == 0:
-                    self.update_ui_metrics()
+                    self.update_ui_metrics(now)
 
-                # Save debug data periodically
-                if self.debug_mode and self.frame_count % self.save_debug_interval == 0:
+                # Save debug data periodically, or when the UI asked for it
+                if self.debug_mode and (self._debug_save_requested or
+                                        self.frame_count % self.save_debug_interval == 0):
+                    self._debug_save_requested = False
                     self.save_debug_data()
 
-                # Draw advanced gesture feedback on frame
-                self.draw_gesture_feedback(frame)
+                # Preview at 1/_render_stride of the frame rate; control runs every frame
+                if render:
+                    # Scale up for display only; the overlay text is laid out for 640x480
+                    if self.preview_size and frame.shape[1::-1] != self.preview_size:
+                        frame = cv2.resize(frame, self.preview_size, interpolation=cv2.INTER_NEAREST)
 
-                # Display frame
-                cv2.imshow('Enhanced Eye Tracking', frame)
+                    # Draw advanced gesture feedback on frame
+                    self.draw_gesture_feedback(frame, now)
 
-                # Handle OpenCV window events
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    self.stop_tracking()
-                    break
-                elif key == ord('+'):
-                    self.sensitivity = min(3.0, self.sensitivity + 0.1)
-                    self.sensitivity_var.set(self.sensitivity)
-                elif key == ord('-'):
-                    self.sensitivity = max(0.1, self.sensitivity - 0.1)
-                    self.sensitivity_var.set(self.sensitivity)
+                    # Hand the frame to the Tk thread; if it has not shown the last one yet, drop this one
+                    try:
+                        self._preview_q.put_nowait(frame)
+                    except queue.Full:
+                        pass
 
                 self.frame_count += 1
 
-                # Maintain target FPS
-                target_frame_time = 1.0 / 30  # 30 FPS
-                if frame_time < target_frame_time:
-                    time.sleep(target_frame_time - frame_time)
-
         except Exception as e:
-            logging.error(f"Error in tracking loop: {e}")
-            logging.error(traceback.format_exc())
-            if self.debug_mode:
-                self.debug_data['errors'].append({
-                    'type': 'tracking_loop',
-                    'error': str(e),
-                    'traceback': traceback.format_exc(),
-                    'timestamp': time.time()
-                })
-        finally:
-            cv2.destroyAllWindows()
+            logging.error(f"Error in tracking loop: {e}", exc_info=True)
+            self._record_error('tracking_loop', e)
 
-    def draw_gesture_feedback(self, frame):
+    def draw_gesture_feedback(self, frame, now):
         """Draw gesture feedback and eye state information on frame"""
         try:
-            current_time = time.time()
-
             # Draw gesture feedback (show for 2 seconds)
-            if current_time - self.gesture_feedback_time < 2.0 and self.last_gesture_feedback:
+            if now - self.gesture_feedback_time < 2.0 and self.last_gesture_feedback:
                 cv2.putText(frame, self.last_gesture_feedback, (10, frame.shape[0] - 60),
                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
 
@@ -724,10 +1003,10 @@ class EnhancedEyeControlledInterface:
         except Exception as e:
             logging.error(f"Error drawing gesture feedback: {e}")
 
-    def update_ui_metrics(self):
+    def update_ui_metrics(self, now):
         """Update UI with current performance metrics"""
         try:
-            elapsed = time.time() - self.start_time
+            elapsed = now - self.start_time
             fps = self.frame_count / elapsed if elapsed > 0 else 0
 
             success_rate = (self.mouse_move_success / self.mouse_move_count * 100) if self.mouse_move_count > 0 else 0
@@ -741,8 +1020,7 @@ class EnhancedEyeControlledInterface:
             self.advanced_gesture_label.config(text=f"Advanced Gestures: {total_advanced}")
 
             # Update gesture feedback (show for 3 seconds)
-            current_time = time.time()
-            if current_time - self.gesture_feedback_time < 3.0 and self.last_gesture_feedback:
+            if now - self.gesture_feedback_time < 3.0 and self.last_gesture_feedback:
                 self.gesture_feedback_label.config(text=f"Last: {self.last_gesture_feedback}")
             else:
                 self.gesture_feedback_label.config(text="Last Gesture: None")
@@ -753,44 +1031,68 @@ class EnhancedEyeControlledInterface:
         """Update sensitivity from UI"""
         self.sensitivity = float(value)
 
-    def save_debug_data(self):
-        """Save comprehensive debug data"""
-        try:
-            import json
+    def save_debug_data(self, flush_rings=False):
+        """Save comprehensive debug data
 
+        Call from the tracking thread, or once it has stopped. The per-frame rings
+        are only written out when flush_rings is set, at shutdown.
+        """
+        try:
             filename = f"eye_tracking_debug_{int(time.time())}.json"
 
             # Calculate statistics
             stats = {
                 'total_frames': self.frame_count,
-                'runtime': time.time() - self.start_time,
+                'runtime': time.monotonic() - self.start_time,
                 'mouse_moves': self.mouse_move_count,
                 'mouse_success_rate': (self.mouse_move_success / self.mouse_move_count * 100) if self.mouse_move_count > 0 else 0,
                 'gestures_detected': self.gesture_count,
                 'advanced_gestures': self.advanced_gesture_stats,
                 'gesture_action_stats': self.gesture_action_processor.get_action_statistics(),
-                'errors_count': len(self.debug_data['errors']),
-                'face_detection_rate': len([x for x in self.debug_data['face_detected'] if x['detected']]) / len(self.debug_data['face_detected']) if self.debug_data['face_detected'] else 0
+                'errors_count': self._errors_count,
+                'face_detection_rate': self._face_detected_count / self._face_total if self._face_total else 0
             }
 
-            debug_export = {
-                'stats': stats,
-                'debug_data': self.debug_data,
-                'settings': {
-                    'sensitivity': self.sensitivity,
-                    'dead_zone': self.dead_zone,
-                    'screen_size': {'w': self.screen_w, 'h': self.screen_h},
-                    'mouse_backend': self.mouse_backend
-                }
+            settings = {
+                'sensitivity': self.sensitivity,
+                'dead_zone': self.dead_zone,
+                'screen_size': {'w': self.screen_w, 'h': self.screen_h},
+                'mouse_backend': self.mouse_backend
             }
 
-            with open(filename, 'w') as f:
-                json.dump(debug_export, f, indent=2)
-
-            print(f"📊 Debug data saved to {filename}")
-            print(f"   Mouse success rate: {stats['mouse_success_rate']:.1f}%")
-            print(f"   Face detection rate: {stats['face_detection_rate']:.1%}")
-            print(f"   Gestures detected: {stats['gestures_detected']}")
+            # Stream the export through a 64 KB buffer, one gesture entry at a
+            # time, instead of building and pretty-printing one big document
+            with open(filename, 'w', buffering=1 << 16) as f:
+                f.write('{"stats": ')
+                json.dump(stats, f)
+                f.write(', "settings": ')
+                json.dump(settings, f)
+                f.write(', "gestures_detected": [')
+                for i, gesture in enumerate(self.debug_data['gestures_detected']):
+                    if i:
+                        f.write(', ')
+                    json.dump(gesture, f)
+                f.write(']}')
+
+            # Whatever the per-frame rings hold since their last full flush
+            if flush_rings:
+                for name in self._debug_rings:
+                    if self._debug_idx[name]:
+                        self._flush_debug_ring(name)
+
+            # Errors carry free-form tracebacks, so new ones are appended to a JSONL sidecar
+            # and leave the deque once written; popleft keeps errors recorded meanwhile
+            errors = self.debug_data['errors']
+            new_errors = [errors.popleft() for _ in range(len(errors))]
+            if new_errors:
+                with open('eye_tracking_debug_errors.jsonl', 'a') as f:
+                    f.writelines(json.dumps(error) + '\n' for error in new_errors)
+
+            if __debug__ and self.verbose:
+                print(f"📊 Debug data saved to {filename}")
+                print(f"   Mouse success rate: {stats['mouse_success_rate']:.1f}%")
+                print(f"   Face detection rate: {stats['face_detection_rate']:.1%}")
+                print(f"   Gestures detected: {stats['gestures_detected']}")
 
         except Exception as e:
             logging.error(f"Error saving debug data: {e}")
@@ -818,9 +1120,9 @@ class EnhancedEyeControlledInterface:
     def cleanup(self):
         """Clean up resources"""
         self.is_running = False
+        self.camera_thread.stop()
         if self.camera:
             self.camera.release()
-        cv2.destroyAllWindows()
         print("✅ Cleanup completed")
 
     def run(self):
@@ -837,7 +1139,10 @@ class EnhancedEyeControlledInterface:
     def on_closing(self):
         """Handle application closing"""
         self.stop_tracking()
-        self.save_debug_data()
+        if self.tracking_thread and self.tracking_thread.is_alive():
+            logging.warning("Tracking thread still running; skipping the final debug save")
+        else:
+            self.save_debug_data(flush_rings=True)
         self.cleanup()
         self.root.destroy()
 
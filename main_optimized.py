@@ -9,12 +9,72 @@ import numpy as np
 import pyautogui
 import mediapipe as mp
 import time
+import queue
 import logging
-from collections import deque
+import logging.handlers
+import atexit
+import threading
 from config_manager import ConfigManager
+import input_backend
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configure logging - records are queued and written by a listener thread so
+# logging from the frame loop never waits on stderr
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+_log_queue = queue.Queue(-1)
+# force=True replaces the default handler installed by any module that logged on import
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)], force=True)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Lid landmarks read for blink detection: left upper/lower, right upper/lower
+EYE_IDX = (159, 145, 386, 374)
+
+@njit(cache=True, fastmath=True)
+def _process_landmarks(cx, cy, lid_ys, pos_buf, pos_count, weights, sens, sw, sh, thresh):
+    """Screen position and blink flag for one frame's landmarks
+
+    (cx, cy) is the normalized cursor landmark and lid_ys the EYE_IDX y
+    values. pos_buf keeps the last scaled positions oldest first in its
+    final rows, with pos_count[0] of them filled; both are updated in
+    place. Row n of weights holds the smoothing weights for n samples,
+    aligned to the end of pos_buf.
+    """
+    rows = pos_buf.shape[0]
+    for r in range(rows - 1):
+        pos_buf[r, 0] = pos_buf[r + 1, 0]
+        pos_buf[r, 1] = pos_buf[r + 1, 1]
+    pos_buf[rows - 1, 0] = cx * sw * sens
+    pos_buf[rows - 1, 1] = cy * sh * sens
+    n = min(pos_count[0] + 1, rows)
+    pos_count[0] = n
+
+    smooth_x = 0.0
+    smooth_y = 0.0
+    for r in range(rows):
+        smooth_x += weights[n, r] * pos_buf[r, 0]
+        smooth_y += weights[n, r] * pos_buf[r, 1]
+
+    # Clamp to screen bounds
+    screen_x = max(0, min(sw - 1, int(smooth_x)))
+    screen_y = max(0, min(sh - 1, int(smooth_y)))
+
+    ratio = 0.5 * (abs(lid_ys[0] - lid_ys[1]) + abs(lid_ys[2] - lid_ys[3]))
+    return screen_x, screen_y, ratio < thresh
 
 class OptimizedEyeInterface:
     def __init__(self):
@@ -24,11 +84,13 @@ class OptimizedEyeInterface:
         # Configuration
         self.config = ConfigManager()
         
-        # MediaPipe setup
+        # MediaPipe setup - without iris refinement FaceMesh skips its attention
+        # sub-model and the cursor follows the eye centre instead of the iris
+        self.use_iris_refine = self.config.get_setting("tracking", "use_iris_refine", True)
         self.mp_face_mesh = mp.solutions.face_mesh
         self.face_mesh = self.mp_face_mesh.FaceMesh(
             max_num_faces=1,
-            refine_landmarks=True,
+            refine_landmarks=self.use_iris_refine,
             min_detection_confidence=0.7,
             min_tracking_confidence=0.7
         )
@@ -40,36 +102,92 @@ class OptimizedEyeInterface:
         self.cam.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         self.cam.set(cv2.CAP_PROP_FPS, 30)
         self.cam.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Reduce buffer for lower latency
+        self.inference_size = (320, 240)  # Frame size handed to FaceMesh
+
+        # Reused per-frame buffers: the mirrored display frame (sized from the
+        # first frame) and the downscaled BGR/RGB inference images
+        self._frame_buf = None
+        self._small_buf = np.empty((self.inference_size[1], self.inference_size[0], 3), dtype=np.uint8)
+        self._rgb_buf = np.empty_like(self._small_buf)
+
+        # Keep OpenCV's own worker threads from competing with MediaPipe's
+        cv2.setNumThreads(1)
         
         # Screen dimensions
         self.screen_w, self.screen_h = pyautogui.size()
         
         # Performance optimizations
-        self.position_history = deque(maxlen=3)  # Reduced for lower latency
-        self.blink_history = deque(maxlen=3)
+        # Last _pos_count[0] positions, oldest first, in the final rows - kept short for lower latency
+        self._pos_buf = np.zeros((3, 2), dtype=np.float64)
+        self._pos_count = np.zeros(1, dtype=np.int64)
         
         # Settings from config with fallbacks
         self.sensitivity = self.config.get_setting("tracking", "sensitivity", 1.2)
         self.smoothing = self.config.get_setting("tracking", "smoothing", 0.5)  # Reduced for responsiveness
         self.blink_threshold = self.config.get_setting("tracking", "blink_threshold", 0.004)
         self.click_cooldown = self.config.get_setting("tracking", "click_cooldown", 0.8)
+
+        # Smoothing weights per buffer fill level (row n = n samples), aligned to
+        # the end of _pos_buf - most recent gets highest weight
+        self._smooth_weights = np.array([
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0],
+            [0.0, self.smoothing, 1 - self.smoothing],
+            [0.2, 0.3, 0.5],
+        ], dtype=np.float64)
+
+        if NUMBA_AVAILABLE:
+            # Compile (or load from cache) now rather than on the first face
+            _process_landmarks(0.5, 0.5, np.zeros(len(EYE_IDX), dtype=np.float64), np.zeros((3, 2)),
+                               np.zeros(1, dtype=np.int64), self._smooth_weights, 1.0, 2, 2, 0.0)
         
         # State tracking
         self.last_click_time = 0
         self.frame_count = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.cursor_enabled = True
         self.show_ui = True
+        self.is_running = False
+        self._key_poll_every = 3
+        self.show_display = True
+        self._display_every = 2
+        self.display_scale = 1.0  # e.g. 0.5 for remote/VNC sessions
+
+        # HUD overlay (crosshair + status text) composited onto display frames;
+        # the text is re-rendered only when _hud_key changes
+        self._overlay = None
+        self._overlay_mask = None
+        self._hud_key = None
+
+        # FaceMesh runs every _frame_skip frames; frames in between reuse the
+        # last landmarks unless the centre of the image changed too much
+        self._frame_skip = 2
+        self._last_landmarks = None
+        self._roi_ref = None
+        self._roi_diff_threshold = 8.0  # Mean absolute grey-level change
+
+        # Capture runs on its own thread; the newest frame waits here for the main loop
+        self._frame_q = queue.Queue(maxsize=1)
+        self._capture = None
         
-        # PyAutoGUI optimizations
+        # PyAutoGUI optimizations - only used when no native input backend is available
         pyautogui.FAILSAFE = False
         pyautogui.PAUSE = 0.001  # Minimal pause for maximum responsiveness
+
+        # Native cursor primitives, bound once for the per-frame path
+        self._move = input_backend.move_to
+        self._click = input_backend.click
         
         # Center cursor initially
-        pyautogui.moveTo(self.screen_w // 2, self.screen_h // 2)
+        self._move(self.screen_w // 2, self.screen_h // 2)
+
+        # Last position sent to the OS; smaller moves (L1, in pixels) are dropped
+        self._last_move = (self.screen_w // 2, self.screen_h // 2)
+        self.move_threshold_px = 1
         
         print(f"✅ Optimized interface initialized")
         print(f"   Screen: {self.screen_w}x{self.screen_h}")
+        print(f"   Input backend: {input_backend.BACKEND}")
         print(f"   Sensitivity: {self.sensitivity}")
         print(f"   Camera: {self.cam.get(cv2.CAP_PROP_FRAME_WIDTH)}x{self.cam.get(cv2.CAP_PROP_FRAME_HEIGHT)}")
         print("\n🎮 Controls:")
@@ -79,80 +197,92 @@ class OptimizedEyeInterface:
         print("   - Press 'c' to toggle cursor control")
         print("   - Press 's' to adjust sensitivity")
         print("   - Press 'h' to toggle UI display")
+        print("   - Press 'd' to toggle video display")
         print("   - Press SPACE to center cursor")
     
-    def smooth_position(self, new_pos):
-        """Apply lightweight smoothing to cursor position"""
-        self.position_history.append(new_pos)
-        
-        if len(self.position_history) < 2:
-            return new_pos
-        
-        # Simple weighted average - optimized for performance
-        if len(self.position_history) == 2:
-            prev_pos = self.position_history[-2]
-            return (
-                prev_pos[0] * self.smoothing + new_pos[0] * (1 - self.smoothing),
-                prev_pos[1] * self.smoothing + new_pos[1] * (1 - self.smoothing)
-            )
-        else:
-            # Use last 3 positions with decreasing weights
-            weights = [0.2, 0.3, 0.5]  # Most recent gets highest weight
-            smooth_x = sum(w * pos[0] for w, pos in zip(weights, self.position_history))
-            smooth_y = sum(w * pos[1] for w, pos in zip(weights, self.position_history))
-            return (smooth_x, smooth_y)
-    
-    def detect_blink(self, landmarks):
-        """Optimized blink detection"""
-        # Left eye landmarks
-        left_top = landmarks[159].y
-        left_bottom = landmarks[145].y
-        left_ratio = abs(left_top - left_bottom)
-        
-        # Right eye landmarks  
-        right_top = landmarks[386].y
-        right_bottom = landmarks[374].y
-        right_ratio = abs(right_top - right_bottom)
-        
-        # Average ratio
-        avg_ratio = (left_ratio + right_ratio) / 2
-        self.blink_history.append(avg_ratio)
-        
-        # Detect blink with threshold
-        return avg_ratio < self.blink_threshold
+    def get_cursor_landmark(self, landmarks):
+        """Normalized point that drives the cursor
+
+        The right iris centre (475) with refined landmarks, otherwise the mean
+        of the same eye's corners (362/263) and lid midpoints (386/374).
+        """
+        if self.use_iris_refine:
+            if len(landmarks) > 475:
+                return landmarks[475].x, landmarks[475].y
+            return None
+
+        eye = [landmarks[i] for i in (362, 263, 386, 374)]
+        return sum(p.x for p in eye) / 4, sum(p.y for p in eye) / 4
+
+    def get_lid_ys(self, landmarks):
+        """Upper/lower lid heights for the left (159/145) and right (386/374) eye"""
+        return np.fromiter((landmarks[i].y for i in EYE_IDX), dtype=np.float64, count=len(EYE_IDX))
     
-    def draw_ui_info(self, frame):
+    def draw_ui_info(self, frame, now):
         """Draw minimal UI information"""
         if not self.show_ui:
             return frame
         
         h, w = frame.shape[:2]
+
+        # Full-frame overlay, sized from the first frame; the crosshair is drawn into it once
+        if self._overlay is None or self._overlay.shape != frame.shape:
+            self._overlay = np.zeros_like(frame)
+            self._overlay_mask = np.zeros((h, w), dtype=bool)
+            self._hud_key = None
+
+            # Draw crosshair at center
+            center_x, center_y = w // 2, h // 2
+            cv2.line(self._overlay, (center_x - 20, center_y), (center_x + 20, center_y), (0, 255, 255), 2)
+            cv2.line(self._overlay, (center_x, center_y - 20), (center_x, center_y + 20), (0, 255, 255), 2)
         
         # Performance info
-        current_time = time.time()
-        elapsed = current_time - self.start_time
+        elapsed = now - self.start_time
         fps = self.frame_count / elapsed if elapsed > 0 else 0
         
-        # Status text
-        status_text = [
-            f"FPS: {fps:.1f}",
-            f"Cursor: {'ON' if self.cursor_enabled else 'OFF'}",
-            f"Sensitivity: {self.sensitivity:.1f}",
-            f"Frames: {self.frame_count}"
-        ]
-        
-        # Draw status
-        for i, text in enumerate(status_text):
-            cv2.putText(frame, text, (10, 30 + i * 25), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        
-        # Draw crosshair at center
-        center_x, center_y = w // 2, h // 2
-        cv2.line(frame, (center_x - 20, center_y), (center_x + 20, center_y), (0, 255, 255), 2)
-        cv2.line(frame, (center_x, center_y - 20), (center_x, center_y + 20), (0, 255, 255), 2)
+        # Re-render the status text only when what it shows changes
+        hud_key = (int(fps), self.cursor_enabled, round(self.sensitivity, 1), self.frame_count // 30)
+        if hud_key != self._hud_key:
+            self._hud_key = hud_key
+
+            # Status text
+            status_text = [
+                f"FPS: {fps:.1f}",
+                f"Cursor: {'ON' if self.cursor_enabled else 'OFF'}",
+                f"Sensitivity: {self.sensitivity:.1f}",
+                f"Frames: {self.frame_count}"
+            ]
+
+            # Draw status
+            self._overlay[10:120, 10:310] = 0
+            for i, text in enumerate(status_text):
+                cv2.putText(self._overlay, text, (10, 30 + i * 25),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+            np.any(self._overlay, axis=2, out=self._overlay_mask)
+
+        # Composite only the overlay's drawn pixels so the camera image shows through;
+        # the bool mask is viewed as the 0/1 uint8 mask cv2.copyTo expects
+        cv2.copyTo(self._overlay, self._overlay_mask.view(np.uint8), frame)
         
         return frame
     
+    def _capture_thread(self):
+        """Read frames continuously, keeping only the newest one for the main loop"""
+        while self.is_running:
+            ret, frame = self.cam.read()
+            if not ret:
+                continue
+
+            # Drop a frame the main loop has not picked up yet
+            try:
+                self._frame_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._frame_q.put_nowait(frame)
+            except queue.Full:
+                pass
+
     def adjust_sensitivity(self):
         """Interactive sensitivity adjustment"""
         print(f"\nCurrent sensitivity: {self.sensitivity:.1f}")
@@ -174,63 +304,97 @@ class OptimizedEyeInterface:
         
         print("\n🚀 Starting optimized eye tracking...")
         print("   Look at the center crosshair to center cursor")
+
+        # Overlap camera reads with MediaPipe inference
+        self.is_running = True
+        self._capture = threading.Thread(target=self._capture_thread, daemon=True)
+        self._capture.start()
         
         try:
             while True:
-                loop_start = time.time()
-                
-                # Capture frame
-                ret, frame = self.cam.read()
-                if not ret:
+                # Newest captured frame
+                try:
+                    frame = self._frame_q.get(timeout=0.1)
+                except queue.Empty:
                     continue
+
+                # One clock read per frame, shared by the click cooldown and the HUD
+                now = time.monotonic()
                 
                 # Flip frame horizontally for mirror effect
-                frame = cv2.flip(frame, 1)
-                
-                # Convert to RGB for MediaPipe
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                if self._frame_buf is None or self._frame_buf.shape != frame.shape:
+                    self._frame_buf = np.empty_like(frame)
+                frame = cv2.flip(frame, 1, dst=self._frame_buf)
                 
-                # Process with MediaPipe
-                results = self.face_mesh.process(rgb_frame)
+                # Cheap validity check for the cached landmarks: grey centre crop difference
+                h, w = frame.shape[:2]
+                roi = cv2.cvtColor(frame[h // 4:3 * h // 4, w // 4:3 * w // 4], cv2.COLOR_BGR2GRAY)
+                run_mesh = (self._last_landmarks is None or self.frame_count % self._frame_skip == 0 or
+                            cv2.absdiff(roi, self._roi_ref).mean() > self._roi_diff_threshold)
+
+                if run_mesh:
+                    # Downscale for inference only - landmarks are normalized, and
+                    # the display keeps the native frame
+                    cv2.resize(frame, self.inference_size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+
+                    # Convert to RGB for MediaPipe
+                    cv2.cvtColor(self._small_buf, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+
+                    # Process with MediaPipe
+                    results = self.face_mesh.process(self._rgb_buf)
+                    self._last_landmarks = (results.multi_face_landmarks[0].landmark
+                                            if results.multi_face_landmarks else None)
+                    self._roi_ref = roi
                 
-                if results.multi_face_landmarks and self.cursor_enabled:
-                    landmarks = results.multi_face_landmarks[0].landmark
+                if self._last_landmarks is not None and self.cursor_enabled:
+                    landmarks = self._last_landmarks
                     
                     # Get iris position (right iris center for better tracking)
-                    if len(landmarks) > 475:
-                        iris_center = landmarks[475]  # Right iris center
+                    iris_center = self.get_cursor_landmark(landmarks)
+                    blink = False
+                    if iris_center:
+                        # Scale, smooth and clamp the cursor and check the lids in one compiled call
+                        screen_x, screen_y, blink = _process_landmarks(
+                            iris_center[0], iris_center[1], self.get_lid_ys(landmarks),
+                            self._pos_buf, self._pos_count, self._smooth_weights,
+                            self.sensitivity, self.screen_w, self.screen_h, self.blink_threshold)
                         
-                        # Convert to screen coordinates with sensitivity
-                        raw_x = iris_center.x * self.screen_w * self.sensitivity
-                        raw_y = iris_center.y * self.screen_h * self.sensitivity
-                        
-                        # Apply smoothing
-                        smooth_x, smooth_y = self.smooth_position((raw_x, raw_y))
-                        
-                        # Clamp to screen bounds
-                        screen_x = max(0, min(self.screen_w - 1, int(smooth_x)))
-                        screen_y = max(0, min(self.screen_h - 1, int(smooth_y)))
-                        
-                        # Move cursor directly - no extra processing
-                        pyautogui.moveTo(screen_x, screen_y)
+                        # Move cursor directly - skipped while the pixel position holds steady
+                        last_x, last_y = self._last_move
+                        if abs(screen_x - last_x) + abs(screen_y - last_y) >= self.move_threshold_px:
+                            self._move(screen_x, screen_y)
+                            self._last_move = (screen_x, screen_y)
                     
                     # Detect blinks for clicking
-                    current_time = time.time()
-                    if (self.detect_blink(landmarks) and 
-                        current_time - self.last_click_time > self.click_cooldown):
+                    # Only fresh landmarks count towards a blink
+                    if (run_mesh and blink and 
+                        now - self.last_click_time > self.click_cooldown):
                         
-                        pyautogui.click()
-                        self.last_click_time = current_time
+                        self._click()
+                        self.last_click_time = now
                         print("🖱️  Click!")
                 
-                # Draw UI
-                frame = self.draw_ui_info(frame)
-                
-                # Display frame
-                cv2.imshow('Optimized Eye Interface', frame)
+                # Draw and show the preview every _display_every frames, and not at all when turned off
+                shown = self.show_display and self.frame_count % self._display_every == 0
+                if shown:
+                    # Draw UI
+                    frame = self.draw_ui_info(frame, now)
+
+                    # Smaller preview for remote/VNC sessions
+                    if self.display_scale != 1.0:
+                        frame = cv2.resize(frame, None, fx=self.display_scale, fy=self.display_scale,
+                                           interpolation=cv2.INTER_AREA)
+
+                    # Display frame
+                    cv2.imshow('Optimized Eye Interface', frame)
                 
-                # Handle keyboard input
-                key = cv2.waitKey(1) & 0xFF
+                # Handle keyboard input - keys are human-speed, so the GUI is only
+                # pumped every _key_poll_every frames, plus on every frame just shown
+                # so that HighGUI paints each preview before the next replaces it
+                if shown or self.frame_count % self._key_poll_every == 0:
+                    key = cv2.waitKey(1) & 0xFF
+                else:
+                    key = 0xFF
                 if key == ord('q') or key == 27:  # 'q' or ESC
                     break
                 elif key == ord('c'):
@@ -243,15 +407,25 @@ class OptimizedEyeInterface:
                 elif key == ord('h'):
                     self.show_ui = not self.show_ui
                     print(f"📊 UI display: {'ON' if self.show_ui else 'OFF'}")
+                elif key == ord('d'):
+                    self.show_display = not self.show_display
+                    if not self.show_display:
+                        # Keep a small window up - HighGUI only delivers keys to a window
+                        placeholder = np.zeros((40, 320, 3), dtype=np.uint8)
+                        cv2.putText(placeholder, "Display off - press 'd'", (10, 27),
+                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 1)
+                        cv2.imshow('Optimized Eye Interface', placeholder)
+                    print(f"📺 Video display: {'ON' if self.show_display else 'OFF'}")
                 elif key == ord(' '):  # Space bar
-                    pyautogui.moveTo(self.screen_w // 2, self.screen_h // 2)
+                    self._move(self.screen_w // 2, self.screen_h // 2)
+                    self._last_move = (self.screen_w // 2, self.screen_h // 2)
                     print("🎯 Cursor centered")
                 
                 # Update performance counter
                 self.frame_count += 1
                 
                 # Optional: Maintain target FPS (comment out for maximum performance)
-                # loop_time = time.time() - loop_start
+                # loop_time = time.monotonic() - now
                 # target_time = 1.0 / 30  # 30 FPS
                 # if loop_time < target_time:
                 #     time.sleep(target_time - loop_time)
@@ -264,12 +438,15 @@ class OptimizedEyeInterface:
     def cleanup(self):
         """Clean up resources"""
         print("🧹 Cleaning up...")
+        self.is_running = False
+        if self._capture:
+            self._capture.join(timeout=1.0)
         if self.cam:
             self.cam.release()
         cv2.destroyAllWindows()
         
         # Final stats
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         avg_fps = self.frame_count / elapsed if elapsed > 0 else 0
         print(f"📊 Final stats:")
         print(f"   Frames processed: {self.frame_count}")
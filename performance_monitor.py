@@ -11,6 +11,34 @@ from typing import Dict, Any, List, Optional, Callable
 from collections import deque
 import json
 import os
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True, fastmath=True)
+def _update_perf_metrics(frame_interval, latency_ms, fps_ring, lat_ring, counts):
+    """Record one frame's FPS and latency sample in the ring buffers"""
+    fps_ring[counts[0] % fps_ring.shape[0]] = 1.0 / frame_interval if frame_interval > 0.0 else 0.0
+    counts[0] += 1
+    lat_ring[counts[1] % lat_ring.shape[0]] = latency_ms
+    counts[1] += 1
+
+def _ring_history(ring: np.ndarray, count: int) -> List[float]:
+    """Ring buffer samples, oldest first"""
+    if count <= ring.shape[0]:
+        return ring[:count].tolist()
+    start = count % ring.shape[0]
+    return ring[start:].tolist() + ring[:start].tolist()
 
 class PerformanceMonitor:
     def __init__(self, config_manager):
@@ -19,8 +47,16 @@ class PerformanceMonitor:
         # Performance metrics
         self.cpu_usage_history = deque(maxlen=60)  # Last 60 seconds
         self.memory_usage_history = deque(maxlen=60)
-        self.fps_history = deque(maxlen=30)
-        self.latency_history = deque(maxlen=100)
+        # Per-frame metrics are written from the tracking thread into fixed
+        # ring buffers; _ring_counts holds the fps/latency sample counts
+        self.fps_ring = np.zeros(30, dtype=np.float32)
+        self.lat_ring = np.zeros(100, dtype=np.float32)
+        self._ring_counts = np.zeros(2, dtype=np.int64)
+
+        if NUMBA_AVAILABLE:
+            # Compile (or load from cache) now rather than on the tracking thread's first frame
+            _update_perf_metrics(1.0, 0.0, np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32),
+                                 np.zeros(2, dtype=np.int64))
         
         # Performance thresholds
         self.max_cpu_usage = self.config.get_setting("performance", "max_cpu_usage", 15.0)
@@ -65,6 +101,16 @@ class PerformanceMonitor:
         self.performance_log = []
         self.log_file = "performance_log.json"
         
+    @property
+    def fps_history(self) -> List[float]:
+        """Recent FPS samples, oldest first"""
+        return _ring_history(self.fps_ring, int(self._ring_counts[0]))
+
+    @property
+    def latency_history(self) -> List[float]:
+        """Recent latency samples in ms, oldest first"""
+        return _ring_history(self.lat_ring, int(self._ring_counts[1]))
+
     def start_monitoring(self):
         """Start performance monitoring"""
         if self.is_monitoring:
@@ -257,13 +303,19 @@ class PerformanceMonitor:
         
         logging.info(f"Performance quality level set to: {level}")
     
+    def record_frame(self, frame_interval: float, latency_ms: float):
+        """Record FPS (from the interval between frames) and latency for one frame"""
+        _update_perf_metrics(frame_interval, latency_ms, self.fps_ring, self.lat_ring, self._ring_counts)
+    
     def update_fps(self, fps: float):
         """Update FPS measurement"""
-        self.fps_history.append(fps)
+        self.fps_ring[self._ring_counts[0] % self.fps_ring.shape[0]] = fps
+        self._ring_counts[0] += 1
     
     def update_latency(self, latency_ms: float):
         """Update latency measurement"""
-        self.latency_history.append(latency_ms)
+        self.lat_ring[self._ring_counts[1] % self.lat_ring.shape[0]] = latency_ms
+        self._ring_counts[1] += 1
     
     def add_performance_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """Add callback for performance updates"""
@@ -381,8 +433,7 @@ class PerformanceMonitor:
         """Reset all performance data"""
         self.cpu_usage_history.clear()
         self.memory_usage_history.clear()
-        self.fps_history.clear()
-        self.latency_history.clear()
+        self._ring_counts[:] = 0
         self.performance_log.clear()
         
         logging.info("Performance data reset")
@@ -74,7 +74,8 @@ class StreamingPlugin(ABC):
     def process_streaming_gestures(self, eye_position: Tuple[float, float], 
                                  gesture_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process streaming-specific gestures"""
-        if not self.is_platform_active():
+        # An activated plugin has already been detected by the caller
+        if not self.is_active and not self.is_platform_active():
             return []
         
         actions = []
@@ -0,0 +1,45 @@
+"""
+Per-frame Tracking Data
+Fixed-layout record returned by the eye trackers for every processed frame
+"""
+
+from typing import Any, Optional, Tuple
+
+class TrackingData:
+    """Slotted per-frame tracking result
+
+    Hot paths read the attributes directly. Existing consumers that treat
+    the result as a dict keep working through get() and item access.
+    """
+
+    __slots__ = ("frame", "landmarks", "face_rect", "eyes", "eye_position", "blink_detected",
+                 "tracking_quality", "left_eye_ratio", "right_eye_ratio")
+
+    def __init__(self, frame=None):
+        self.frame = frame
+        self.landmarks = None
+        self.face_rect = None
+        self.eyes = []
+        self.eye_position: Optional[Tuple[float, float]] = None
+        self.blink_detected = False
+        self.tracking_quality = 0.0
+        self.left_eye_ratio = 0.0
+        self.right_eye_ratio = 0.0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup; unknown keys return the default"""
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        # Every slot always exists, so 'in' means "has a value", as a missing dict key did
+        return key in self.__slots__ and getattr(self, key) is not None
@@ -9,7 +9,7 @@ import cv2
 import numpy as np
 import threading
 import time
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable
 import logging
 
 try:
@@ -33,6 +33,7 @@ class EyeTrackingOverlay:
 
         # Overlay window for real-time feedback
         self.overlay_window = None
+        self.video_size = (400, 300)
         self.show_overlay = self.config.get_setting("display", "show_overlay", True)
 
         # UI state
@@ -321,6 +322,10 @@ class EyeTrackingOverlay:
             # Video display
             self.video_label = ttk.Label(self.overlay_window)
             self.video_label.pack(fill=tk.BOTH, expand=True)
+
+            # Frames are pasted into this photo in place instead of creating one per frame
+            self.video_photo = ImageTk.PhotoImage("RGB", self.video_size)
+            self.video_label.configure(image=self.video_photo)
         else:
             # Text-based status display when video is not available
             status_frame = ttk.Frame(self.overlay_window)
@@ -341,20 +346,13 @@ class EyeTrackingOverlay:
 
         try:
             # Resize frame for display
-            display_frame = cv2.resize(frame, (400, 300))
-
-            # Convert to RGB
-            rgb_frame = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-
-            # Convert to PIL Image
-            pil_image = Image.fromarray(rgb_frame)
+            display_frame = cv2.resize(frame, self.video_size)
 
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(pil_image)
+            # Wrap the BGR buffer without copying; Pillow swaps channels while pasting
+            pil_image = Image.frombuffer("RGB", self.video_size, display_frame, "raw", "BGR", 0, 1)
 
-            # Update label
-            self.video_label.configure(image=photo)
-            self.video_label.image = photo  # Keep a reference
+            # Update the existing photo in place
+            self.video_photo.paste(pil_image)
 
         except Exception as e:
             logging.error(f"Error updating video display: {e}")
@@ -390,10 +388,19 @@ class EyeTrackingOverlay:
 
     def add_gesture_event(self, gesture_info: Dict[str, Any]):
         """Add gesture event to the display"""
+        self.add_gesture_events([gesture_info])
+
+    def add_gesture_events(self, gesture_infos: List[Dict[str, Any]]):
+        """Add a batch of gesture events to the display with a single insert"""
+        if not gesture_infos:
+            return
+
         timestamp = time.strftime("%H:%M:%S")
-        gesture_text = f"[{timestamp}] {gesture_info.get('action', 'Unknown')}"
+        gesture_texts = [f"[{timestamp}] {gesture_info.get('action', 'Unknown')}"
+                         for gesture_info in reversed(gesture_infos)]
 
-        self.gesture_listbox.insert(0, gesture_text)
+        # Newest first
+        self.gesture_listbox.insert(0, *gesture_texts)
 
         # Keep only last 50 entries
         if self.gesture_listbox.size() > 50: